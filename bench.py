@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""main.py 크롤러 성능 측정 스크립트
+
+- record: 실제 사이트에서 각 소스의 목록/상세 응답을 받아 bench_fixtures/에 기록
+- replay: 기록한 응답을 로컬 HTTP 서버로 재생하며 소스별 시간/요청 수/바이트/최대 메모리 측정
+- parse:  기록한 페이지로 전체 트리 파싱과 대상 하위 트리 파싱 비교
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+import main
+
+
+FIXTURES_DIR = Path(__file__).parent / "bench_fixtures"
+KAKAO_LIST_URL = "https://game.kakao.com/pr/ajax/list"
+# 기록한 날과 재생하는 날에 따라 달라지는 쿼리 파라미터 (재생 시 비교에서 제외)
+VOLATILE_PARAMS = {"searchDate"}
+
+
+# ──────────────────────────────────────────────
+# 응답 기록 저장소
+# ──────────────────────────────────────────────
+
+class FixtureStore:
+    """URL별 응답 본문과 상태 코드, Content-Type을 디렉터리에 보관합니다."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.index_file = root / "index.json"
+        self._lock = threading.Lock()
+        self.index = {}
+        if self.index_file.exists():
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+
+    def save(self, url: str, status: int, content_type: str, body: bytes) -> None:
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            (self.root / name).write_bytes(body)
+            self.index[url] = {"file": name, "status": status, "content_type": content_type}
+            with open(self.index_file, "w", encoding="utf-8") as f:
+                json.dump(self.index, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+    @staticmethod
+    def _match_key(url: str) -> tuple[str, tuple]:
+        path, _, query = url.partition("?")
+        params = sorted((k, v) for k, v in parse_qsl(query, keep_blank_values=True) if k not in VOLATILE_PARAMS)
+        return path, tuple(params)
+
+    def lookup(self, url: str) -> tuple[dict, bytes] | None:
+        """URL에 맞는 기록을 찾습니다. 날짜에 따라 바뀌는 파라미터(예: 네이버 기준일)만 다르면 그 기록을 사용합니다.
+
+        나머지 파라미터(예: offset)까지 같아야 하므로 기록하지 않은 페이지는 None입니다.
+        """
+        entry = self.index.get(url)
+        if entry is None:
+            key = self._match_key(url)
+            entry = next((e for u, e in self.index.items() if self._match_key(u) == key), None)
+        if entry is None:
+            return None
+        return entry, (self.root / entry["file"]).read_bytes()
+
+    def read_text(self, url: str) -> str | None:
+        found = self.lookup(url)
+        return found[1].decode("utf-8", errors="replace") if found else None
+
+
+class RecordingAdapter(HTTPAdapter):
+    """주고받은 응답을 FixtureStore에 기록하는 requests 어댑터입니다."""
+
+    def __init__(self, store: FixtureStore, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        # stream=True 요청도 본문을 모두 읽어 기록 (이후 iter_content는 읽어 둔 본문을 사용)
+        self.store.save(request.url, response.status_code, response.headers.get("Content-Type", ""), response.content)
+        return response
+
+
+def recording_context_hook(store: FixtureStore):
+    """브라우저 컨텍스트의 모든 GET 요청을 실제로 보내고 응답을 FixtureStore에 기록하는 훅을 반환합니다."""
+    def handle(route):
+        try:
+            response = route.fetch()
+        except Exception:
+            route.abort()
+            return
+        if route.request.method == "GET":
+            store.save(route.request.url, response.status, response.headers.get("content-type", ""), response.body())
+        route.fulfill(response=response)
+
+    return lambda context: context.route("**/*", handle)
+
+
+def replay_context_hook(store: FixtureStore):
+    """브라우저 컨텍스트의 모든 요청을 기록된 응답으로 돌려주고, 기록에 없는 요청은 막는 훅을 반환합니다."""
+    def handle(route):
+        found = store.lookup(route.request.url) if route.request.method == "GET" else None
+        if found is None:
+            route.abort()
+            return
+        entry, body = found
+        route.fulfill(status=entry["status"], content_type=entry["content_type"] or "text/html; charset=utf-8", body=body)
+
+    return lambda context: context.route("**/*", handle)
+
+
+# ──────────────────────────────────────────────
+# 로컬 재생 서버
+# ──────────────────────────────────────────────
+
+def start_replay_server(store: FixtureStore) -> tuple[ThreadingHTTPServer, callable]:
+    """기록된 응답을 돌려주는 로컬 서버를 띄우고, 실제 URL을 서버 URL로 바꾸는 함수를 함께 반환합니다.
+
+    https://host/path?q 는 http://127.0.0.1:PORT/https/host/path?q 로 바뀝니다.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            scheme, _, rest = self.path.lstrip("/").partition("/")
+            found = store.lookup(f"{scheme}://{rest}")
+            if found is None:
+                self.send_error(404)
+                return
+            entry, body = found
+            self.send_response(entry["status"])
+            self.send_header("Content-Type", entry["content_type"] or "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    def rewrite(url: str) -> str:
+        parts = urlsplit(url)
+        if parts.hostname == "127.0.0.1":
+            return url
+        query = f"?{parts.query}" if parts.query else ""
+        return f"http://127.0.0.1:{port}/{parts.scheme}/{parts.netloc}{parts.path}{query}"
+
+    return server, rewrite
+
+
+def use_fresh_state(workdir: Path) -> None:
+    """조건부 요청, 상세 조회 캐시, 저장된 목록이 결과를 바꾸지 않도록 빈 상태 디렉터리에서 시작합니다."""
+    main.use_state_dir(workdir)
+
+
+# ──────────────────────────────────────────────
+# 기록 / 재생
+# ──────────────────────────────────────────────
+
+def record(fixtures_dir: Path, keys: list[str]) -> int:
+    """실제 사이트에서 각 소스를 실행하며 모든 HTTP 응답을 기록합니다.
+
+    Google Play는 HTTP 방식으로 한 번, 브라우저 방식으로 한 번 더 실행해 페이지가 불러오는
+    스크립트 / XHR 응답까지 기록합니다. (브라우저 방식 재생이 실제 사이트에 접속하지 않도록)
+    """
+    store = FixtureStore(fixtures_dir / "responses")
+    adapter = RecordingAdapter(store, pool_connections=16, pool_maxsize=main.HTTP_MAX_PER_HOST)
+    session = main.http_session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    main.GPLAY_MODE = "http"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        use_fresh_state(Path(tmp))
+        for key in keys:
+            name, fetch_fn, _ = main.SOURCES[key]
+            main._source_ctx.key = key
+            try:
+                games = list(fetch_fn())
+                print(f"[{name}] {len(games)}개 기록")
+            except Exception as e:
+                print(f"[{name}] 기록 실패: {e}")
+
+        if "gplay" in keys:
+            main.GPLAY_MODE = "browser"
+            main.browser_context_hook = recording_context_hook(store)
+            main._source_ctx.key = "gplay"
+            try:
+                games = list(main.fetch_gplay_games())
+                print(f"[Google Play 브라우저] {len(games)}개 기록")
+            except Exception as e:
+                print(f"[Google Play 브라우저] 기록 실패: {e}")
+            finally:
+                main.browser_context_hook = None
+    print(f"\n{len(store.index)}개 응답 기록: {store.root}")
+    return 0
+
+
+def measure_fetcher(key: str, verbose: bool) -> dict:
+    """fetcher 하나를 실행해 시간, 요청 수, 바이트, 단계별 시간, 최대 메모리를 측정합니다."""
+    name, fetch_fn, _ = main.SOURCES[key]
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+
+    def run() -> tuple[list | None, str | None]:
+        main._source_ctx.key = key
+        # 실제 실행과 같은 시간 제한 (기록이 맞지 않아 페이지를 끝없이 넘기는 경우에도 끝남)
+        main._source_ctx.deadline = time.monotonic() + main.SOURCE_TIMEOUTS[key]
+        try:
+            with output:
+                return list(fetch_fn()), None
+        except Exception as e:
+            return None, f"{type(e).__name__}: {e}"
+        finally:
+            main._source_ctx.deadline = None
+
+    result = {"source": key, "name": name}
+    with tempfile.TemporaryDirectory() as tmp:
+        # 1회차: 시간/요청/바이트 (tracemalloc 없이)
+        use_fresh_state(Path(tmp))
+        main.metrics.reset()
+        started = time.perf_counter()
+        games, error = run()
+        result["wall"] = time.perf_counter() - started
+        stats = main.metrics.sources.get(key, {"phases": {}, "requests": 0, "bytes": 0})
+        result.update(requests=stats["requests"], bytes=stats["bytes"], phases=dict(stats["phases"]))
+        result["items"] = len(games) if games is not None else None
+        result["error"] = error
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 2회차: 최대 메모리
+        use_fresh_state(Path(tmp))
+        tracemalloc.start()
+        run()
+        _, result["peak"] = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return result
+
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """기준 결과보다 느려지거나 요청/바이트가 늘거나 항목 수가 바뀐 소스를 찾습니다."""
+    problems = []
+    base_by_key = {r["source"]: r for r in baseline}
+    for r in results:
+        base = base_by_key.get(r["source"])
+        if base is None:
+            continue
+        if r["items"] != base["items"]:
+            problems.append(f"{r['name']}: 항목 수 {base['items']} → {r['items']} (파서 확인 필요)")
+        for field in ("wall", "requests", "bytes", "peak"):
+            if base[field] and r[field] > base[field] * (1 + tolerance):
+                problems.append(f"{r['name']}: {field} {base[field]:,.3f} → {r[field]:,.3f}")
+    return problems
+
+
+def replay(fixtures_dir: Path, keys: list[str], args) -> int:
+    store = FixtureStore(fixtures_dir / "responses")
+    if not store.index:
+        print("기록된 응답이 없습니다. 먼저 `python bench.py record`를 실행하세요.")
+        return 1
+
+    server, main.url_rewriter = start_replay_server(store)
+    # 브라우저 방식은 페이지의 하위 요청까지 모두 기록으로 응답 (기록에 없는 요청은 실제 사이트로 보내지 않고 막음)
+    main.browser_context_hook = replay_context_hook(store)
+    if args.gplay_mode:
+        main.GPLAY_MODE = args.gplay_mode
+    try:
+        results = [measure_fetcher(key, args.verbose) for key in keys]
+    finally:
+        main.url_rewriter = None
+        main.browser_context_hook = None
+        server.shutdown()
+
+    print(f"{'소스':<12} {'시간(s)':>8} {'요청':>6} {'바이트':>12} {'최대 메모리':>12} {'항목':>6}  단계별 시간")
+    for r in results:
+        phases = ", ".join(f"{k} {v:.2f}s" for k, v in r["phases"].items())
+        items = "실패" if r["items"] is None else r["items"]
+        print(
+            f"{r['name']:<12} {r['wall']:>8.2f} {r['requests']:>6} {r['bytes']:>12,} "
+            f"{r['peak'] / 1024 / 1024:>10.1f}MB {items:>6}  {phases}"
+        )
+        if r["error"]:
+            print(f"  오류: {r['error']}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            problems = compare(results, json.load(f), args.tolerance)
+        if problems:
+            print("\n성능 저하 / 파서 이상:")
+            for p in problems:
+                print(f"  - {p}")
+            return 1
+        print("\n기준 대비 이상 없음")
+    return 0
+
+
+# ──────────────────────────────────────────────
+# 파싱 벤치마크
+# ──────────────────────────────────────────────
+
+# 이름 → (전체 트리 파싱, 대상 하위 트리만 파싱)
+PARSE_CASES = {
+    "inven_list": (
+        lambda html: BeautifulSoup(html, "html.parser").select("li.item a[href*='/campaign/']"),
+        lambda html: main.parse_html(html, "li", ["item"]).select("li.item a[href*='/campaign/']"),
+    ),
+    "inven_detail": (
+        lambda html: BeautifulSoup(html, "html.parser").select_one("div.information > p.company"),
+        lambda html: main.parse_html(html, "div", ["information"]).select_one("div.information > p.company"),
+    ),
+    "kakao_list": (
+        lambda html: BeautifulSoup(html, "html.parser").select("li.js-ar-item, li.js-pr-item"),
+        lambda html: main.parse_html(html, "li", ["js-ar-item", "js-pr-item"]).select("li.js-ar-item, li.js-pr-item"),
+    ),
+}
+
+
+def recorded_pages(store: FixtureStore) -> dict:
+    """파싱 벤치마크에 쓸 페이지를 기록에서 찾습니다."""
+    pages = {
+        "inven_list": store.read_text(main.INVEN_URL),
+        "kakao_list": store.read_text(KAKAO_LIST_URL),
+    }
+    detail_url = next((u for u in store.index if "pick.inven.co.kr/campaign/" in u), None)
+    pages["inven_detail"] = store.read_text(detail_url) if detail_url else None
+    return pages
+
+
+def measure(fn, arg, repeat: int) -> tuple[float, int, object]:
+    """fn(arg)의 평균 실행 시간(초), 최대 메모리(bytes), 결과를 반환합니다."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(arg)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    fn(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def bench_parse(fixtures_dir: Path, repeat: int) -> int:
+    pages = recorded_pages(FixtureStore(fixtures_dir / "responses"))
+
+    print(f"HTML 파서: {main.HTML_PARSER} (기준: html.parser 전체 트리)\n")
+    print(f"{'페이지':<14} {'전체(ms)':>10} {'대상(ms)':>10} {'전체 메모리':>12} {'대상 메모리':>12} {'결과 일치':>8}")
+
+    ran = 0
+    for name, (full_fn, targeted_fn) in PARSE_CASES.items():
+        html = pages.get(name)
+        if html is None:
+            print(f"{name:<14} (기록 없음)")
+            continue
+
+        full_time, full_peak, full_result = measure(full_fn, html, repeat)
+        targeted_time, targeted_peak, targeted_result = measure(targeted_fn, html, repeat)
+        same = str(full_result) == str(targeted_result)
+        print(
+            f"{name:<14} {full_time * 1000:>10.2f} {targeted_time * 1000:>10.2f} "
+            f"{full_peak / 1024:>10.0f}KB {targeted_peak / 1024:>10.0f}KB {'O' if same else 'X':>8}"
+        )
+        ran += 1
+
+    if not ran:
+        print("\n기록된 페이지가 없습니다. 먼저 `python bench.py record`를 실행하세요.")
+        return 1
+    return 0
+
+
+def main_cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="크롤러 성능 측정")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR, help="기록 디렉터리")
+    parser.add_argument("--sources", default=",".join(main.SOURCES), help="측정할 소스 (쉼표로 구분)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("record", help="실제 사이트에서 응답을 받아 기록")
+
+    replay_cmd = sub.add_parser("replay", help="기록된 응답을 로컬 서버로 재생하며 소스별 성능 측정")
+    replay_cmd.add_argument("--gplay-mode", choices=["auto", "http", "browser"], help="Google Play 수집 방식")
+    replay_cmd.add_argument("--save", help="측정 결과를 JSON으로 저장")
+    replay_cmd.add_argument("--compare", help="저장해 둔 기준 결과와 비교 (이상이 있으면 종료 코드 1)")
+    replay_cmd.add_argument("--tolerance", type=float, default=0.2, help="허용 증가율 (기본 0.2 = 20%%)")
+    replay_cmd.add_argument("--verbose", action="store_true", help="크롤러 로그 출력")
+
+    parse_cmd = sub.add_parser("parse", help="기록된 페이지로 HTML 파싱 시간/메모리 비교")
+    parse_cmd.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    keys = [k for k in args.sources.split(",") if k]
+    unknown = [k for k in keys if k not in main.SOURCES]
+    if unknown:
+        parser.error(f"알 수 없는 소스: {', '.join(unknown)}")
+
+    if args.command == "record":
+        return record(args.fixtures, keys)
+    if args.command == "replay":
+        return replay(args.fixtures, keys, args)
+    return bench_parse(args.fixtures, args.repeat)
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -1,167 +1,1529 @@
 #!/usr/bin/env python3
 """Google Play & 인벤 & 카카오 & 원스토어 & 네이버게임 사전등록 게임 모니터링 시스템"""
 
+import argparse
+import codecs
+import cProfile
+import hashlib
+import importlib.util
+import itertools
 import json
 import os
+import queue
+import random
 import re
+import signal
+import sqlite3
 import sys
-from datetime import datetime
+import threading
+import time
+import tracemalloc
+import unicodedata
+import zlib
+from collections import deque
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode, urlsplit
 
-import requests as req
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+if TYPE_CHECKING:
+    import bs4
+
+
+# ──────────────────────────────────────────────
+# 지연 import
+# ──────────────────────────────────────────────
+
+class _LazyModule:
+    """처음 속성에 접근할 때 모듈을 불러옵니다.
+
+    requests / bs4 / playwright는 그것을 쓰는 소스가 실제로 실행될 때만 불러오므로,
+    일부 소스만 실행할 때는 시작이 빠르고 설치되지 않은 의존성도 필요 없습니다.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+req = _LazyModule("requests")
+_bs4 = _LazyModule("bs4")
+_playwright = _LazyModule("playwright.sync_api")
 
 
 # 설정
 BASE_DIR = Path(__file__).parent
-GAMES_FILE = BASE_DIR / "games.json"
-INVEN_GAMES_FILE = BASE_DIR / "inven_games.json"
-KAKAO_GAMES_FILE = BASE_DIR / "kakao_games.json"
-ONESTORE_GAMES_FILE = BASE_DIR / "onestore_games.json"
-NAVER_GAMES_FILE = BASE_DIR / "naver_games.json"
+# 상태 파일(목록 JSON, 캐시, 인덱스, 보고서)을 둘 디렉터리 (--state-dir로도 지정 가능)
+STATE_DIR = Path(os.environ.get("STATE_DIR") or BASE_DIR)
+GAMES_FILE = STATE_DIR / "games.json"
+INVEN_GAMES_FILE = STATE_DIR / "inven_games.json"
+KAKAO_GAMES_FILE = STATE_DIR / "kakao_games.json"
+ONESTORE_GAMES_FILE = STATE_DIR / "onestore_games.json"
+NAVER_GAMES_FILE = STATE_DIR / "naver_games.json"
+ENRICH_CACHE_FILE = STATE_DIR / "enrich_cache.json"
+# (선택) SQLite 상태 저장소 경로. 설정하면 신규 판정과 이력을 DB로 관리하고 JSON 파일은 내보내기로 유지
+STATE_DB = os.environ.get("STATE_DB")
+LISTING_STATE_FILE = STATE_DIR / "listing_state.json"
+GAME_INDEX_FILE = STATE_DIR / "game_index.json"
+RUN_REPORT_FILE = STATE_DIR / "run_report.json"
+# 목록 스냅샷 보관소 (소스별 목록이 바뀔 때마다 열 단위로 압축해 덧붙임, archive 명령으로 기간별 조회)
+ARCHIVE_DIR = STATE_DIR / "archive"
+# 아직 전송하지 못한 Slack 메시지 (전송에 성공해야 지워짐)
+SLACK_OUTBOX_FILE = STATE_DIR / "slack_outbox.json"
 SLACK_WEBHOOK_URL = os.environ.get("SLACK_WEBHOOK_URL")
+# Slack 메시지 하나에 넣을 수 있는 최대 블록 수
+SLACK_MAX_BLOCKS = 50
+# 종료 전 미전송 메시지를 기다리는 최대 시간(초), 4xx 응답이 이 횟수만큼 반복되면 메시지 폐기
+SLACK_DRAIN_TIMEOUT = 60
+SLACK_MAX_REJECTS = 3
 
 # URL
-GPLAY_URL = "https://play.google.com/store/apps/collection/promotion_3000000d51_pre_registration_games?hl=ko"
+# Google Play: 크롤링할 컬렉션 URL과 로케일 (쉼표로 구분해 환경변수로 지정 가능)
+# 모든 컬렉션을 로케일마다 한 번씩 조회하며, 후보 앱은 컬렉션 / 로케일을 통틀어 한 번만 상세 확인
+GPLAY_COLLECTIONS = [url.strip() for url in os.environ.get(
+    "GPLAY_COLLECTIONS",
+    "https://play.google.com/store/apps/collection/promotion_3000000d51_pre_registration_games",
+).split(",") if url.strip()]
+GPLAY_LOCALES = [locale.strip() for locale in os.environ.get("GPLAY_LOCALES", "ko-KR").split(",") if locale.strip()]
 INVEN_URL = "https://pick.inven.co.kr/"
 KAKAO_URL = "https://game.kakao.com/pr"
 ONESTORE_URL = "https://m.onestore.co.kr/v2/ko-kr/event/preregistrations"
 NAVER_API_URL = "https://comm-api.game.naver.com/nng_main/v1/home/launchGameOfMonth"
 
+# HTTP 공통 설정
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+HTTP_TIMEOUT = 15
+HTTP_DETAIL_TIMEOUT = 10
+# 호스트별 동시 요청 수
+HTTP_MAX_PER_HOST = int(os.environ.get("HTTP_MAX_PER_HOST", "4"))
+
+# 호스트별 요청 속도 제한 (토큰 버킷: 초당 요청 수, 순간 허용량)
+HTTP_RATE_PER_HOST = float(os.environ.get("HTTP_RATE_PER_HOST", "8"))
+HTTP_BURST_PER_HOST = int(os.environ.get("HTTP_BURST_PER_HOST", "8"))
+# 재시도: 연결 오류 / 타임아웃 / 아래 상태 코드일 때 지수 백오프(지터 포함)로 재시도, Retry-After가 있으면 따름
+HTTP_MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", "2"))
+HTTP_BACKOFF_BASE = 0.5
+HTTP_BACKOFF_MAX = 30.0
+HTTP_RETRY_STATUSES = {429, 500, 502, 503, 504}
+# 회로 차단: 호스트에 연속 실패가 쌓이면 일정 시간 요청을 보내지 않음
+CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_SECONDS = 60
+
+# 샤드 결과 파일 디렉터리, 실행 ID (같은 실행의 샤드끼리 같은 값을 써야 함)
+SHARD_DIR = STATE_DIR / "shards"
+RUN_ID = os.environ.get("RUN_ID") or os.environ.get("GITHUB_RUN_ID")
+
+# 감시 모드(watch) 소스별 기본 실행 간격(초), 브라우저를 새로 띄우기 전까지 재사용할 실행 횟수
+WATCH_INTERVALS = {
+    "gplay": 3600,
+    "inven": 1800,
+    "kakao": 300,
+    "onestore": 300,
+    "naver": 1800,
+}
+WATCH_BROWSER_MAX_USES = int(os.environ.get("WATCH_BROWSER_MAX_USES", "12"))
+
+# 네이버게임 API 페이지 크기, 이번 달 외에 함께 조회할 다음 달 수
+NAVER_PAGE_SIZE = 100
+NAVER_MONTHS_AHEAD = int(os.environ.get("NAVER_MONTHS_AHEAD", "0"))
+
+# HTML 파서: lxml이 설치되어 있으면 사용
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Google Play 수집 방식: "auto"(HTTP 우선, 실패 시 브라우저) | "http" | "browser"
+GPLAY_MODE = os.environ.get("GPLAY_MODE", "auto")
+# HTTP 응답에는 컬렉션의 첫 묶음만 들어 있으므로(나머지는 스크롤 시 로드), auto 모드에서 HTTP로 찾은 게임이
+# 저장된 목록의 이 비율에 못 미치면 브라우저로 나머지를 확인
+GPLAY_HTTP_MIN_RATIO = 0.8
+
+# Google Play 상세 페이지를 동시에 확인할 페이지 수
+GPLAY_DETAIL_CONCURRENCY = int(os.environ.get("GPLAY_DETAIL_CONCURRENCY", "4"))
+# 상세 페이지에서 받지 않을 리소스 종류와 분석/광고 호스트
+GPLAY_BLOCKED_RESOURCES = {"image", "media", "font"}
+GPLAY_BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net", "play.google.com/log")
+GPLAY_DETAIL_TIMEOUT_MS = 15000
+
+# 상세 조회 캐시: 소스별 유효 기간(초)과 최대 항목 수
+ENRICH_CACHE_TTL = {
+    "gplay": 14 * 86400,
+    "inven": 7 * 86400,
+    "onestore": 7 * 86400,
+}
+ENRICH_CACHE_MAX_ENTRIES = 5000
+
+# 소스 간 같은 게임 판정: 정규화 제목의 바이그램 Dice 유사도 기준
+# 정규화 제목이 GAME_MATCH_SHORT_LENGTH자 미만이면 한 글자 차이도 크게 작용하므로 더 높은 기준 적용
+GAME_MATCH_THRESHOLD = 0.75
+GAME_MATCH_SHORT_LENGTH = 6
+GAME_MATCH_SHORT_THRESHOLD = 0.9
+
+# 소스별 실행 시간 제한 (초)
+SOURCE_TIMEOUTS = {
+    "gplay": 900,
+    "inven": 180,
+    "kakao": 60,
+    "onestore": 180,
+    "naver": 60,
+}
+# 시간 제한이 지나도 끝나지 않는 소스(협조적 중단이 닿지 않는 블로킹 호출)를 포기하기 전 여유 시간 (초)
+SOURCE_HUNG_GRACE = 30
+
 
 # ──────────────────────────────────────────────
-# Google Play 크롤링
+# 실행 시간 제한
 # ──────────────────────────────────────────────
 
-def fetch_gplay_games() -> list[dict]:
-    """Google Play에서 사전등록 게임 목록을 가져옵니다."""
-    games = []
-    seen_ids = set()
+class SourceTimeout(Exception):
+    """소스 실행 시간 제한을 초과했을 때 발생합니다."""
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            locale="ko-KR",
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        page = context.new_page()
 
-        print(f"[Google Play] 페이지 로드 중...")
-        try:
-            page.goto(GPLAY_URL, timeout=60000)
-            page.wait_for_load_state("networkidle", timeout=30000)
-        except PlaywrightTimeout:
-            print("  페이지 로드 타임아웃, 계속 진행...")
-
-        # 스크롤
-        prev_height = 0
-        for i in range(20):
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(800)
-            curr_height = page.evaluate("document.body.scrollHeight")
-            if curr_height == prev_height:
-                break
-            prev_height = curr_height
+_source_ctx = threading.local()
 
-        # 앱 링크 추출
-        app_links = page.locator("a[href*='/store/apps/details']").all()
 
-        candidates = []
-        for link in app_links:
-            try:
-                href = link.get_attribute("href")
-                if not href:
-                    continue
+def check_deadline() -> None:
+    """현재 스레드에서 실행 중인 소스의 시간 제한을 초과했으면 중단합니다."""
+    deadline = getattr(_source_ctx, "deadline", None)
+    if deadline is not None and time.monotonic() > deadline:
+        raise SourceTimeout()
 
-                app_id_match = re.search(r"id=([a-zA-Z0-9_.]+)", href)
-                if not app_id_match:
-                    continue
 
-                app_id = app_id_match.group(1)
-                if app_id in seen_ids:
-                    continue
+def deadline_sleep(seconds: float) -> None:
+    """현재 소스의 시간 제한을 넘지 않는 범위에서 기다립니다. 기다리는 중 제한에 걸리면 중단합니다."""
+    deadline = getattr(_source_ctx, "deadline", None)
+    if deadline is not None:
+        seconds = min(seconds, max(0.0, deadline - time.monotonic()))
+    time.sleep(seconds)
+    check_deadline()
 
-                title = link.inner_text().strip()
-                if title:
-                    title = title.split("\n")[0].strip()
-
-                if not title or len(title) < 2:
-                    img = link.locator("img").first
-                    if img.count() > 0:
-                        title = img.get_attribute("alt") or app_id
-
-                if title and len(title) >= 2:
-                    seen_ids.add(app_id)
-                    candidates.append({
-                        "id": app_id,
-                        "title": title,
-                        "url": f"https://play.google.com/store/apps/details?id={app_id}&hl=ko",
-                    })
-            except Exception:
-                continue
 
-        # 게임 카테고리 + 한국 개발사 필터링
-        print(f"[Google Play] 한국 개발사 게임 필터링 중... (후보 {len(candidates)}개)")
-        for app in candidates:
+# ──────────────────────────────────────────────
+# 실행 측정
+# ──────────────────────────────────────────────
+
+class RunMetrics:
+    """소스별 단계 소요 시간, 요청 수/지연 시간, 받은 바이트 수, 재시도, 항목 수를 모읍니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = datetime.now()
+        self.sources = {}
+
+    def _source(self, key: str) -> dict:
+        return self.sources.setdefault(key, {
+            "status": "running",
+            "duration": None,
+            "phases": {},
+            "requests": 0,
+            "bytes": 0,
+            "latencies": [],
+            "retries": 0,
+            "items": {},
+        })
+
+    def add_phase(self, key: str, name: str, seconds: float) -> None:
+        with self._lock:
+            phases = self._source(key)["phases"]
+            phases[name] = phases.get(name, 0.0) + seconds
+
+    def add_request(self, key: str, nbytes: int = 0, latency: float | None = None) -> None:
+        with self._lock:
+            source = self._source(key)
+            source["requests"] += 1
+            source["bytes"] += nbytes
+            if latency is not None:
+                source["latencies"].append(latency)
+
+    def add_bytes(self, key: str, nbytes: int) -> None:
+        with self._lock:
+            self._source(key)["bytes"] += nbytes
+
+    def add_retry(self, key: str) -> None:
+        with self._lock:
+            self._source(key)["retries"] += 1
+
+    def set_items(self, key: str, **counts: int) -> None:
+        with self._lock:
+            self._source(key)["items"].update(counts)
+
+    def finish(self, key: str, status: str, duration: float) -> None:
+        with self._lock:
+            source = self._source(key)
+            source["status"] = status
+            source["duration"] = duration
+
+    def export(self, key: str) -> dict | None:
+        """소스의 측정값 원본을 복사해 반환합니다. (샤드 결과 파일용)"""
+        with self._lock:
+            source = self.sources.get(key)
+            return json.loads(json.dumps(source)) if source is not None else None
+
+    def load(self, key: str, data: dict) -> None:
+        """다른 프로세스에서 측정한 소스 지표(report()의 소스 항목)를 그대로 가져옵니다."""
+        with self._lock:
+            self.sources[key] = dict(data)
+
+    def reset(self, key: str | None = None) -> None:
+        """지표를 비웁니다. key가 있으면 그 소스의 지표만 비웁니다."""
+        with self._lock:
+            if key is not None:
+                self.sources.pop(key, None)
+                return
+            self.started_at = datetime.now()
+            self.sources = {}
+
+    def report(self) -> dict:
+        """실행 보고서(JSON으로 저장할 dict)를 만듭니다. 지연 시간은 요약값으로 바꿉니다."""
+        with self._lock:
+            sources = {}
+            for key, source in self.sources.items():
+                latencies = sorted(source["latencies"])
+                summary = {"count": len(latencies)}
+                if latencies:
+                    summary.update(
+                        avg=round(sum(latencies) / len(latencies), 4),
+                        p50=round(latencies[len(latencies) // 2], 4),
+                        p95=round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 4),
+                        max=round(latencies[-1], 4),
+                    )
+                sources[key] = {
+                    **{k: v for k, v in source.items() if k != "latencies"},
+                    "duration": round(source["duration"], 4) if source["duration"] is not None else None,
+                    "phases": {k: round(v, 4) for k, v in source["phases"].items()},
+                    "latency": summary,
+                }
+        return {
+            "started_at": self.started_at.isoformat(),
+            "finished_at": datetime.now().isoformat(),
+            "sources": sources,
+        }
+
+    def write_report(self, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+
+    def write_prometheus(self, path: Path) -> None:
+        """node_exporter textfile collector 형식으로 저장합니다. (임시 파일에 쓴 뒤 교체)"""
+        report = self.report()
+        lines = [
+            "# HELP gtm_run_timestamp_seconds 마지막 실행 완료 시각",
+            "# TYPE gtm_run_timestamp_seconds gauge",
+            f"gtm_run_timestamp_seconds {time.time():.0f}",
+        ]
+        metric_defs = [
+            ("gtm_source_success", "소스 실행 성공 여부 (1 = 성공)", lambda s: [("", 1 if s["status"] in ("ok", "unchanged") else 0)]),
+            ("gtm_source_duration_seconds", "소스 실행 시간", lambda s: [("", s["duration"] or 0)]),
+            ("gtm_source_phase_seconds", "소스 단계별 시간", lambda s: [(f',phase="{k}"', v) for k, v in s["phases"].items()]),
+            ("gtm_source_requests", "소스 요청 수", lambda s: [("", s["requests"])]),
+            ("gtm_source_bytes", "소스가 받은 바이트 수", lambda s: [("", s["bytes"])]),
+            ("gtm_source_retries", "소스 재시도 수", lambda s: [("", s["retries"])]),
+            ("gtm_source_request_latency_p95_seconds", "소스 요청 지연 p95", lambda s: [("", s["latency"].get("p95", 0))]),
+            ("gtm_source_items", "소스 항목 수", lambda s: [(f',kind="{k}"', v) for k, v in s["items"].items()]),
+        ]
+        for name, help_text, values in metric_defs:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for key, source in report["sources"].items():
+                for labels, value in values(source):
+                    lines.append(f'{name}{{source="{key}"{labels}}} {value}')
+
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        tmp.replace(path)
+
+
+metrics = RunMetrics()
+
+
+def current_source() -> str:
+    """현재 스레드에서 실행 중인 소스 키를 반환합니다."""
+    return getattr(_source_ctx, "key", None) or "-"
+
+
+class PhaseClock:
+    """이전 구간이 끝난 시점부터 lap()까지의 시간을 현재 소스의 단계 시간으로 기록합니다."""
+
+    def __init__(self):
+        self._last = time.perf_counter()
+
+    def lap(self, name: str) -> None:
+        now = time.perf_counter()
+        metrics.add_phase(current_source(), name, now - self._last)
+        self._last = now
+
+
+# ──────────────────────────────────────────────
+# 소스별 출력
+# ──────────────────────────────────────────────
+
+class SourceOutput:
+    """여러 소스가 동시에 실행될 때 로그가 줄 중간에서 섞이지 않도록 stdout을 대신합니다.
+
+    buffer(key)로 모으기 시작한 소스의 스레드(작업 스레드 포함)가 쓴 내용은 release(key)에서 한 번에 쓰고,
+    그 밖의 스레드 출력은 스레드별로 줄이 끝날 때까지 모았다가 잠금을 잡고 줄 단위로 씁니다.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._buffers = {}
+        self._partial = threading.local()
+
+    def write(self, text: str) -> int:
+        key = getattr(_source_ctx, "key", None)
+        with self._lock:
+            if key in self._buffers:
+                self._buffers[key].append(text)
+                return len(text)
+        pending = getattr(self._partial, "text", "") + text
+        head, newline, self._partial.text = pending.rpartition("\n")
+        if newline:
+            with self._lock:
+                self.stream.write(head + newline)
+        return len(text)
+
+    def flush(self) -> None:
+        pending = getattr(self._partial, "text", "")
+        self._partial.text = ""
+        with self._lock:
+            self.stream.write(pending)
+            self.stream.flush()
+
+    def buffer(self, key: str) -> None:
+        with self._lock:
+            self._buffers[key] = []
+
+    def release(self, key: str) -> None:
+        """key 소스의 모아 둔 출력을 씁니다. 이후 그 소스의 출력은 줄 단위로 바로 씁니다."""
+        with self._lock:
+            text = "".join(self._buffers.pop(key, []))
+            if text:
+                self.stream.write(text if text.endswith("\n") else text + "\n")
+                self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+@contextmanager
+def source_output(key: str):
+    """sys.stdout이 SourceOutput이면 블록 안에서 key 소스의 출력을 모았다가 끝날 때 한 번에 씁니다."""
+    output = sys.stdout if isinstance(sys.stdout, SourceOutput) else None
+    if output is not None:
+        output.buffer(key)
+    try:
+        yield
+    finally:
+        if output is not None:
+            output.release(key)
+
+
+def release_source_output(key: str) -> None:
+    """응답 없는 소스의 지금까지 출력을 씁니다. (결과를 기다리지 않고 진행할 때)"""
+    if isinstance(sys.stdout, SourceOutput):
+        sys.stdout.release(key)
+
+
+# ──────────────────────────────────────────────
+# 게임 레코드
+# ──────────────────────────────────────────────
+
+class GameRecord(MutableMapping):
+    """수집한 게임 한 건입니다. 모든 소스가 같은 형식을 씁니다.
+
+    정해진 필드는 슬롯에 두어 dict보다 메모리를 적게 쓰고, 그 밖의 키는 extra에 보관합니다.
+    dict처럼 읽고 쓸 수 있으며, 값을 넣지 않은 필드는 없는 키로 취급합니다.
+    키 순서는 FIELDS 순서(값이 있는 필드만) 다음 extra 순서입니다.
+    """
+
+    FIELDS = ("id", "title", "url", "release_date", "reward", "platform", "developer")
+    __slots__ = FIELDS + ("extra",)
+
+    def __init__(self, data=(), **fields):
+        self.extra = None
+        self.update(data, **fields)
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self.FIELDS:
             try:
-                page.goto(app["url"], timeout=15000)
-                page.wait_for_timeout(1000)
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
 
-                # 게임 카테고리 확인
-                game_category = page.locator("a[href*='/store/apps/category/GAME']")
-                if game_category.count() == 0:
-                    print(f"  - [게임아님] {app['title']}")
-                    continue
+    def __iter__(self):
+        for field in self.FIELDS:
+            if hasattr(self, field):
+                yield field
+        if self.extra:
+            yield from self.extra
 
-                # 한국 개발사 확인 (개발자 정보에 South Korea가 있는지)
-                html = page.content()
-                if 'South Korea' not in html:
-                    print(f"  - [해외] {app['title']}")
-                    continue
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
 
-                # 개발사 이름 추출
-                dev_link = page.locator("a[href*='/store/apps/dev']").first
-                developer = ""
-                if dev_link.count() > 0:
-                    developer = dev_link.inner_text().strip()
+    def __repr__(self) -> str:
+        return f"GameRecord({self.to_dict()!r})"
 
-                app["developer"] = developer
-                games.append(app)
-                print(f"  + {app['title']} ({developer})")
-            except Exception:
+    def to_dict(self) -> dict:
+        return dict(self)
+
+
+def _json_default(obj):
+    """json.dump(s)의 default 훅: GameRecord를 dict로 바꿔 직렬화합니다."""
+    if isinstance(obj, GameRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# ──────────────────────────────────────────────
+# 상세 조회 캐시
+# ──────────────────────────────────────────────
+
+class EnrichCache:
+    """소스+ID별 상세 페이지 조회 결과를 유효 기간과 함께 디스크에 보관합니다.
+
+    "[게임아님]", "[해외]"처럼 제외된 결과도 그대로 저장해 다음 실행에서 다시 조회하지 않습니다.
+    """
+
+    def __init__(self, filepath: Path, ttl: dict, max_entries: int):
+        self.filepath = filepath
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            self._entries = {}
+            if self.filepath.exists():
+                try:
+                    with open(self.filepath, "r", encoding="utf-8") as f:
+                        self._entries = json.load(f).get("entries", {})
+                except (json.JSONDecodeError, IOError):
+                    pass
+        return self._entries
+
+    def get(self, source: str, item_id: str, stale: bool = False) -> dict | None:
+        """유효 기간 안의 캐시 값을 반환합니다. 없거나 만료되었으면 None.
+
+        stale=True면 만료된 값도 반환합니다. (상세 조회 실패 시 이전 값 유지용)
+        """
+        with self._lock:
+            entry = self._load().get(f"{source}:{item_id}")
+        if entry is None:
+            return None
+        if not stale and time.time() - entry["at"] > self.ttl.get(source, 0):
+            return None
+        return entry["value"]
+
+    def put(self, source: str, item_id: str, value: dict) -> None:
+        with self._lock:
+            self._load()[f"{source}:{item_id}"] = {"at": time.time(), "value": value}
+
+    def export(self, since: float) -> dict:
+        """since 이후에 기록된 항목을 반환합니다. (샤드 결과 파일용)"""
+        with self._lock:
+            return {key: entry for key, entry in self._load().items() if entry["at"] >= since}
+
+    def merge(self, entries: dict) -> None:
+        """다른 프로세스가 기록한 항목을 합칩니다. 같은 키는 더 최근 항목을 남깁니다."""
+        with self._lock:
+            own = self._load()
+            for key, entry in entries.items():
+                if key not in own or own[key]["at"] < entry["at"]:
+                    own[key] = entry
+
+    def save(self) -> None:
+        """만료 항목을 지우고, 최대 개수를 넘으면 오래된 항목부터 버린 뒤 저장합니다."""
+        with self._lock:
+            if self._entries is None:
+                return
+            now = time.time()
+            entries = {
+                key: entry for key, entry in self._entries.items()
+                if now - entry["at"] <= self.ttl.get(key.split(":", 1)[0], 0)
+            }
+            if len(entries) > self.max_entries:
+                newest = sorted(entries.items(), key=lambda kv: kv[1]["at"], reverse=True)
+                entries = dict(newest[:self.max_entries])
+            self._entries = entries
+            with open(self.filepath, "w", encoding="utf-8") as f:
+                json.dump({"entries": entries}, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+enrich_cache = EnrichCache(ENRICH_CACHE_FILE, ENRICH_CACHE_TTL, ENRICH_CACHE_MAX_ENTRIES)
+
+
+# ──────────────────────────────────────────────
+# HTTP 클라이언트
+# ──────────────────────────────────────────────
+
+_http_session = None
+_http_lock = threading.Lock()
+_host_slots = {}
+_host_buckets = {}
+_host_breakers = {}
+
+# 요청 URL 변환 훅: 벤치마크 재생 시 실제 사이트 대신 로컬 서버로 보내는 데 사용
+url_rewriter = None
+# 브라우저 컨텍스트 훅: 벤치마크 기록 / 재생 시 컨텍스트의 모든 요청을 가로채는 데 사용 (context.route)
+browser_context_hook = None
+
+
+def resolve_url(url: str) -> str:
+    return url_rewriter(url) if url_rewriter else url
+
+
+def resolve_page_url(url: str) -> str:
+    """브라우저로 열 URL. 컨텍스트 훅이 요청을 가로채면 페이지의 하위 요청도 원래 주소 기준이 되도록 그대로 씁니다."""
+    return url if browser_context_hook else resolve_url(url)
+
+
+def http_session():
+    """호스트별 연결을 재사용하는 공용 requests 세션을 반환합니다."""
+    global _http_session
+    with _http_lock:
+        if _http_session is None:
+            session = req.Session()
+            adapter = req.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=HTTP_MAX_PER_HOST)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+            _http_session = session
+        return _http_session
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷입니다."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """토큰을 하나 꺼냅니다. 없으면 채워질 때까지 기다립니다."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            deadline_sleep(wait)
+
+
+class CircuitOpen(Exception):
+    """호스트의 회로가 열려 있어 요청을 보내지 않았을 때 발생합니다."""
+
+
+class CircuitBreaker:
+    """연속 실패가 threshold번 쌓이면 reset_after초 동안 요청을 막고, 그 뒤 시험 요청 하나만 허용합니다."""
+
+    def __init__(self, host: str, threshold: int, reset_after: float):
+        self.host = host
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 확인합니다. 회로가 열려 있으면 CircuitOpen을 발생시킵니다.
+
+        시험 요청이면 True를 반환합니다. 시험 요청은 결과를 success() / failure() / cancel() 중
+        하나로 반드시 알려야 하며, 그 전까지 다른 요청은 막힙니다.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if not self._probing and time.monotonic() - self._opened_at >= self.reset_after:
+                self._probing = True
+                return True
+        raise CircuitOpen(f"{self.host} 회로 차단 중")
+
+    def success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._failures < self.threshold:
+                return
+            if self._opened_at is None:
+                print(f"[HTTP] {self.host} 연속 {self._failures}회 실패, {self.reset_after:.0f}초 동안 요청 중단")
+            self._opened_at = time.monotonic()
+
+    def cancel(self) -> None:
+        """호스트와 관계없는 이유로 끝난 시험 요청을 취소합니다. 다음 allow()에서 다시 시험합니다."""
+        with self._lock:
+            self._probing = False
+
+
+def _per_host(table: dict, host: str, factory):
+    with _http_lock:
+        if host not in table:
+            table[host] = factory()
+        return table[host]
+
+
+def _host_slot(host: str) -> threading.BoundedSemaphore:
+    return _per_host(_host_slots, host, lambda: threading.BoundedSemaphore(HTTP_MAX_PER_HOST))
+
+
+def _host_bucket(host: str) -> TokenBucket:
+    return _per_host(_host_buckets, host, lambda: TokenBucket(HTTP_RATE_PER_HOST, HTTP_BURST_PER_HOST))
+
+
+def _host_breaker(host: str) -> CircuitBreaker:
+    return _per_host(_host_breakers, host,
+                     lambda: CircuitBreaker(host, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SECONDS))
+
+
+def _retry_after(response) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 기다릴 초로 바꿉니다. 없거나 해석할 수 없으면 None."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff_delay(attempt: int, retry_after: float | None) -> float:
+    if retry_after is not None:
+        return min(retry_after, HTTP_BACKOFF_MAX)
+    return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * 2 ** attempt))
+
+
+def http_get(url: str, timeout: float = HTTP_TIMEOUT, retries: int = HTTP_MAX_RETRIES, **kwargs):
+    """호스트별 속도 / 동시 요청 수를 제한하며 공용 세션으로 GET 요청을 보냅니다.
+
+    연결 오류, 타임아웃, 429/5xx 응답은 지수 백오프로 retries번까지 재시도합니다.
+    재시도까지 실패하면 호스트 회로에 실패로 기록하고, 회로가 열린 호스트에는 요청 없이 CircuitOpen을 발생시킵니다.
+    회로가 반쯤 열린 상태의 시험 요청은 재시도하지 않고 첫 결과를 바로 회로에 기록합니다.
+    stream=True로 받은 본문의 바이트 수는 읽는 쪽에서 count_bytes로 기록합니다.
+    """
+    url = resolve_url(url)
+    host = urlsplit(url).netloc
+    breaker = _host_breaker(host)
+    key = current_source()
+    for attempt in range(retries + 1):
+        probe = breaker.allow()
+        last = probe or attempt == retries
+        try:
+            _host_bucket(host).acquire()
+            with _host_slot(host):
+                response = http_session().get(url, timeout=timeout, **kwargs)
+            nbytes = 0 if kwargs.get("stream") else len(response.content)
+        except (req.ConnectionError, req.Timeout):
+            if last:
+                breaker.failure()
+                raise
+            delay = _backoff_delay(attempt, None)
+        except BaseException:
+            # 시간 초과 등 호스트와 관계없는 이유로 끝나도 시험 요청 상태는 풀어 둠
+            if probe:
+                breaker.cancel()
+            raise
+        else:
+            metrics.add_request(key, nbytes, response.elapsed.total_seconds())
+            if response.status_code not in HTTP_RETRY_STATUSES:
+                breaker.success()
+                return response
+            if last:
+                breaker.failure()
+                return response
+            delay = _backoff_delay(attempt, _retry_after(response))
+            response.close()
+        metrics.add_retry(key)
+        deadline_sleep(delay)
+
+
+def count_bytes(chunks):
+    """조각을 그대로 넘기면서 받은 바이트 수를 현재 소스에 기록합니다."""
+    key = current_source()
+    for chunk in chunks:
+        metrics.add_bytes(key, len(chunk))
+        yield chunk
+
+
+def capture_source_ctx():
+    """현재 스레드의 소스 컨텍스트(시간 제한, 측정 키)를 작업 스레드에 그대로 적용하는 함수를 반환합니다."""
+    deadline = getattr(_source_ctx, "deadline", None)
+    key = getattr(_source_ctx, "key", None)
+
+    def apply():
+        _source_ctx.deadline = deadline
+        _source_ctx.key = key
+
+    return apply
+
+
+def stream_map(fn, items, lookup=None):
+    """items를 받는 대로 fn을 동시에 적용하고 (항목, 결과)를 입력 순서대로 하나씩 돌려줍니다. (제너레이터)
+
+    앞 항목의 결과가 나오는 즉시 돌려주므로 목록을 다 읽기 전에 첫 결과를 쓸 수 있습니다.
+    lookup(item)이 None이 아닌 값(캐시 등)을 돌려주면 fn을 호출하지 않고 그 값을 결과로 씁니다.
+    실패한 항목의 결과는 발생한 예외 객체이며, 미리 진행하는 항목은 HTTP_MAX_PER_HOST * 2개까지입니다.
+    """
+    apply_ctx = capture_source_ctx()
+
+    def run(item):
+        apply_ctx()
+        try:
+            check_deadline()
+            return fn(item)
+        except Exception as e:
+            return e
+
+    window = deque()
+    pool = ThreadPoolExecutor(max_workers=HTTP_MAX_PER_HOST)
+    try:
+        for item in items:
+            known = lookup(item) if lookup else None
+            window.append((item, known, None if known is not None else pool.submit(run, item)))
+            # 앞에서부터 끝난 항목은 바로 내보내고, 창이 가득 차면 맨 앞 항목을 기다림
+            while window and (window[0][2] is None or window[0][2].done() or len(window) > HTTP_MAX_PER_HOST * 2):
+                item, known, future = window.popleft()
+                yield item, future.result() if future else known
+        while window:
+            item, known, future = window.popleft()
+            yield item, future.result() if future else known
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_END = object()
+
+
+class BackgroundIterator:
+    """background_iter가 반환하는 이터레이터입니다. close()를 부르면 생산 스레드가 멈춥니다."""
+
+    def __init__(self, items: queue.Queue, stop: threading.Event):
+        self._items = items
+        self._stop = stop
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._stop.is_set():
+            raise StopIteration
+        item = self._items.get()
+        if item is _END:
+            self.close()
+            raise StopIteration
+        if isinstance(item, _Failure):
+            self.close()
+            raise item.error
+        return item
+
+    def close(self) -> None:
+        self._stop.set()
+
+
+def background_iter(make_iter, maxsize: int) -> BackgroundIterator:
+    """make_iter()가 만드는 이터레이터를 별도 스레드에서 미리 읽고, 받은 순서대로 돌려주는 이터레이터를 반환합니다.
+
+    큐가 가득 차면 생산 스레드가 기다리므로 미리 읽어 두는 양은 maxsize개를 넘지 않습니다.
+    생산 중 발생한 예외는 소비하는 쪽에서 다시 발생합니다. 끝까지 읽지 않을 수 있으면
+    (읽기 시작하지 않은 경우 포함) 반드시 close()를 불러 생산 스레드를 멈춰야 합니다.
+    """
+    items = queue.Queue(maxsize)
+    stop = threading.Event()
+    apply_ctx = capture_source_ctx()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.5)
+                return True
+            except queue.Full:
                 continue
+        return False
+
+    def produce():
+        apply_ctx()
+        try:
+            for item in make_iter():
+                if not put(item):
+                    return
+            put(_END)
+        except BaseException as e:
+            put(_Failure(e))
+
+    threading.Thread(target=produce, daemon=True).start()
+    return BackgroundIterator(items, stop)
+
+
+def parse_html(markup: str, name: str, classes: list[str] | None = None, **attrs) -> "bs4.BeautifulSoup":
+    """name 태그 중 classes 중 하나를 가진 요소의 하위 트리만 파싱합니다. 나머지 문서는 트리로 만들지 않습니다."""
+    if classes:
+        # 파싱 중에는 class 속성이 나뉘기 전 문자열 그대로 비교되므로 단어 단위 정규식으로 매칭
+        attrs["class"] = re.compile(r"(?:^|\s)(?:%s)(?:\s|$)" % "|".join(map(re.escape, classes)))
+    return _bs4.BeautifulSoup(markup, HTML_PARSER, parse_only=_bs4.SoupStrainer(name, attrs=attrs))
+
+
+def saved_lookup(source: str):
+    """소스의 저장된 목록에서 id로 레코드를 찾는 함수를 반환합니다. 파일은 처음 찾을 때 한 번만 읽습니다."""
+    by_id = None
+
+    def find(record_id: str) -> GameRecord | None:
+        nonlocal by_id
+        if by_id is None:
+            by_id = {g["id"]: g for g in load_saved(SOURCES[source][2])}
+        return by_id.get(record_id)
+    return find
+
+
+def enrich_stream(source: str, games, fetch_developer):
+    """목록에서 레코드를 받는 대로 상세 페이지를 조회해 개발사를 채우고, 목록 순서대로 하나씩 돌려줍니다. (제너레이터)
+
+    캐시에 있고 만료되지 않은 항목은 조회하지 않습니다. 조회에 실패한 항목(회로 차단 포함)은
+    만료된 이전 조회 결과를 쓰고, 캐시에도 없으면 저장된 목록의 개발사를 그대로 씁니다.
+    """
+    def fetch(game):
+        value = {"developer": fetch_developer(game["url"])}
+        enrich_cache.put(source, game["id"], value)
+        return value
+
+    saved = saved_lookup(source)
+    failed = 0
+    for game, value in stream_map(fetch, games, lookup=lambda g: enrich_cache.get(source, g["id"])):
+        if isinstance(value, Exception):
+            failed += 1
+            value = enrich_cache.get(source, game["id"], stale=True) or saved(game["id"])
+        if value and value.get("developer") is not None:
+            game["developer"] = value["developer"]
+            print(f"  [개발사] {game['title']} → {game['developer']}")
+        yield game
+    check_deadline()
+    if failed:
+        print(f"  [개발사] 상세 조회 실패 {failed}건, 이전 조회 결과 유지")
 
-        browser.close()
 
-    print(f"[Google Play] 총 {len(games)}개 게임 발견\n")
-    return games
+# ──────────────────────────────────────────────
+# 목록 변경 감지 (조건부 GET + 본문 해시)
+# ──────────────────────────────────────────────
+
+class ListingUnchanged(Exception):
+    """목록이 이전 실행과 같아서 파싱할 필요가 없을 때 발생합니다."""
+
+
+class ListingState:
+    """소스별 목록 응답의 ETag / Last-Modified / 본문 해시를 보관합니다.
+
+    새 값은 stage()로 임시 보관했다가 해당 소스의 결과가 저장된 뒤에 commit()으로 반영합니다.
+    """
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self._state = None
+        self._staged = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self._state is None:
+            self._state = {}
+            if self.filepath.exists():
+                try:
+                    with open(self.filepath, "r", encoding="utf-8") as f:
+                        self._state = json.load(f)
+                except (json.JSONDecodeError, IOError):
+                    pass
+        return self._state
+
+    def get(self, source: str) -> dict:
+        with self._lock:
+            return self._load().get(source, {})
+
+    def stage(self, source: str, value: dict) -> None:
+        with self._lock:
+            self._staged[source] = value
+
+    def staged(self, source: str) -> dict | None:
+        with self._lock:
+            return self._staged.get(source)
+
+    def forget(self, source: str) -> None:
+        with self._lock:
+            self._load().pop(source, None)
+            self._staged.pop(source, None)
+
+    def commit(self, source: str) -> None:
+        with self._lock:
+            if source in self._staged:
+                self._load()[source] = self._staged.pop(source)
+
+    def save(self) -> None:
+        with self._lock:
+            if self._state is None:
+                return
+            with open(self.filepath, "w", encoding="utf-8") as f:
+                json.dump(self._state, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+listing_state = ListingState(LISTING_STATE_FILE)
+
+
+def fetch_listing(source: str, url: str, params: dict | None = None, headers: dict | None = None):
+    """목록 페이지를 조건부 GET으로 가져옵니다.
+
+    서버가 304를 주거나 본문 해시가 이전과 같으면 ListingUnchanged를 발생시킵니다.
+    """
+    request_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    previous = listing_state.get(source)
+    headers = dict(headers or {})
+    if previous.get("request") == request_key:
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+
+    response = http_get(url, params=params, headers=headers)
+    if response.status_code == 304:
+        raise ListingUnchanged()
+    response.raise_for_status()
+
+    check_listing_digest(
+        source,
+        request_key,
+        hashlib.sha256(response.content).hexdigest(),
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    return response
+
+
+def check_listing_digest(source: str, request_key: str, digest: str, etag: str | None = None,
+                         last_modified: str | None = None) -> None:
+    """목록 본문 해시가 이전 실행과 같으면 ListingUnchanged를 발생시키고, 다르면 새 값을 임시 보관합니다."""
+    if listing_state.get(source).get("sha256") == digest:
+        raise ListingUnchanged()
+    listing_state.stage(source, {
+        "request": request_key,
+        "etag": etag,
+        "last_modified": last_modified,
+        "sha256": digest,
+    })
 
 
 # ──────────────────────────────────────────────
-# 인벤 사전예약 크롤링
+# Google Play 크롤링
 # ──────────────────────────────────────────────
 
-def fetch_inven_games() -> list[dict]:
-    """인벤에서 사전예약 게임 목록을 가져옵니다."""
-    games = []
+# 상세 페이지 판정에 필요한 노드가 생기면 카테고리 / 개발사 / 주소를 한 번에 읽음 (준비 전에는 null)
+GPLAY_DETAIL_PROBE = """() => {
+    const dev = document.querySelector("a[href*='/store/apps/dev']");
+    const category = document.querySelector("a[href*='/store/apps/category/']");
+    const state = document.readyState;
+    if (!(dev && category && state !== "loading") && state !== "complete") return null;
+    return {
+        game: !!document.querySelector("a[href*='/store/apps/category/GAME']"),
+        developer: dev ? dev.innerText.trim() : "",
+        korea: document.documentElement.textContent.includes("South Korea"),
+    };
+}"""
+
+
+def _block_heavy_resources(route) -> None:
+    """상세 페이지의 이미지 / 미디어 / 폰트와 분석 요청을 막습니다."""
+    request = route.request
+    if request.resource_type in GPLAY_BLOCKED_RESOURCES or any(host in request.url for host in GPLAY_BLOCKED_HOSTS):
+        route.abort()
+    else:
+        # 컨텍스트에 걸린 라우트(벤치마크 재생 등)가 있으면 그쪽으로 넘김
+        route.fallback()
 
-    print(f"[인벤] 페이지 로드 중...")
+
+def _start_gplay_detail(page, app: dict) -> float | None:
+    """상세 페이지 로드를 시작합니다. 로드를 기다리지 않고 시작 시각을 반환합니다."""
     try:
-        response = req.get(
-            INVEN_URL,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
-            timeout=15
-        )
-        response.raise_for_status()
-    except req.RequestException as e:
-        print(f"[인벤] 페이지 로드 실패: {e}")
-        return games
+        page.goto(resolve_page_url(app["url"]), timeout=GPLAY_DETAIL_TIMEOUT_MS, wait_until="commit")
+        return time.monotonic()
+    except Exception:
+        return None
+
 
-    soup = BeautifulSoup(response.text, "html.parser")
+def _check_gplay_detail(page, app: dict, started_at: float) -> dict | None:
+    """로드 중인 상세 페이지에서 게임 카테고리 + 한국 개발사 여부를 확인합니다.
 
-    # 사전예약 캠페인 항목 추출
+    고정 대기 없이 판정에 필요한 노드가 생기는 즉시 한 번의 evaluate로 확인합니다.
+    결과는 {"status": "ok" | "not_game" | "foreign", "developer": ...} 형태이며, 확인에 실패하면 None입니다.
+    """
+    try:
+        remaining_ms = GPLAY_DETAIL_TIMEOUT_MS - (time.monotonic() - started_at) * 1000
+        probe = page.wait_for_function(GPLAY_DETAIL_PROBE, timeout=max(remaining_ms, 1000))
+        info = probe.json_value()
+        probe.dispose()
+    except Exception:
+        return None
+
+    if not info["game"]:
+        return {"status": "not_game"}
+    # 한국 개발사 확인 (개발자 정보에 South Korea가 있는지)
+    if not info["korea"]:
+        return {"status": "foreign"}
+    return {"status": "ok", "developer": info["developer"]}
+
+
+def _gplay_fallback_result(app_id: str, saved) -> dict | None:
+    """상세 확인에 실패한 앱의 판정: 만료된 캐시 판정, 없으면 저장된 목록에 있던 앱은 통과로 봅니다.
+
+    saved는 saved_lookup("gplay")가 반환한 함수입니다.
+    """
+    result = enrich_cache.get("gplay", app_id, stale=True)
+    if result is None:
+        before = saved(app_id)
+        if before is not None:
+            result = {"status": "ok", "developer": before.get("developer", "")}
+    return result
+
+
+def _accept_gplay_app(app: dict, result: dict | None) -> bool:
+    """상세 확인 결과를 app에 반영하고 한국 개발사 게임인지 반환합니다."""
+    if result is None:
+        return False
+    if result["status"] == "not_game":
+        print(f"  - [게임아님] {app['title']}")
+        return False
+    if result["status"] == "foreign":
+        print(f"  - [해외] {app['title']}")
+        return False
+
+    app["developer"] = result.get("developer", "")
+    print(f"  + {app['title']} ({app['developer']})")
+    return True
+
+
+class GplayExtractionError(Exception):
+    """HTTP 응답에서 Google Play 데이터를 추출하지 못했을 때 발생합니다."""
+
+
+def gplay_listings() -> list[tuple[str, str]]:
+    """(컬렉션 URL, 로케일) 조합을 로케일 순서대로 반환합니다. URL에는 로케일의 언어 코드를 hl로 붙입니다."""
+    listings = []
+    for locale in GPLAY_LOCALES:
+        language = locale.split("-")[0]
+        for collection in GPLAY_COLLECTIONS:
+            separator = "&" if "?" in collection else "?"
+            listings.append((f"{collection}{separator}hl={language}", locale))
+    return listings
+
+
+def _gplay_listing_label(url: str, locale: str) -> str:
+    return f"{urlsplit(url).path.rsplit('/', 1)[-1]} / {locale}"
+
+
+def _collect_gplay_candidates(links, seen_ids: set | None = None):
+    """앱 링크({href, text, alt})를 받는 대로 중복 없이 앱 후보(id, 제목)를 만들어 돌려줍니다. (제너레이터)
+
+    alt는 링크 안에 이미지가 없으면 None입니다. 여러 컬렉션에 걸쳐 중복을 없애려면 같은 seen_ids를 넘깁니다.
+    """
+    seen_ids = set() if seen_ids is None else seen_ids
+    for link in links:
+        app_id_match = re.search(r"id=([a-zA-Z0-9_.]+)", link.get("href") or "")
+        if not app_id_match:
+            continue
+
+        app_id = app_id_match.group(1)
+        if app_id in seen_ids:
+            continue
+
+        title = (link.get("text") or "").strip()
+        if title:
+            title = title.split("\n")[0].strip()
+
+        if len(title) < 2 and link.get("alt") is not None:
+            title = link["alt"] or app_id
+
+        if len(title) >= 2:
+            seen_ids.add(app_id)
+            yield GameRecord(
+                id=app_id,
+                title=title,
+                url=f"https://play.google.com/store/apps/details?id={app_id}&hl=ko",
+            )
+
+
+def _parse_gplay_collection(html: str, seen_ids: set | None = None):
+    """컬렉션 페이지 HTML에서 앱 후보(id, 제목)를 하나씩 추출합니다. (제너레이터)"""
+    soup = parse_html(html, "a", href=re.compile(r"/store/apps/details"))
+
+    def links():
+        for link in soup.select("a[href*='/store/apps/details']"):
+            img = link.find("img")
+            yield {
+                "href": link.get("href"),
+                "text": link.get_text("\n", strip=True),
+                "alt": img.get("alt", "") if img else None,
+            }
+
+    return _collect_gplay_candidates(links(), seen_ids)
+
+
+def _parse_gplay_detail(html: str) -> dict | None:
+    """상세 페이지 HTML에 포함된 구조화 데이터(JSON-LD)로 게임/한국 개발사 여부를 판정합니다.
+
+    결과 형식은 _check_gplay_detail과 같으며, 구조화 데이터가 없으면 None입니다.
+    """
+    match = re.search(r'<script type="application/ld\+json"[^>]*>(.*?)</script>', html, re.S)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group(1))
+    except json.JSONDecodeError:
+        return None
+
+    if not str(data.get("applicationCategory", "")).startswith("GAME"):
+        return {"status": "not_game"}
+    # 개발자 주소는 페이지에 포함된 데이터(AF_initDataCallback)에 들어 있음
+    if "South Korea" not in html:
+        return {"status": "foreign"}
+    author = data.get("author") or {}
+    return {"status": "ok", "developer": (author.get("name") or "").strip()}
+
+
+def _fetch_gplay_detail_http(app: dict) -> dict | None:
+    response = http_get(app["url"], timeout=HTTP_DETAIL_TIMEOUT, headers={"Accept-Language": "ko-KR"})
+    response.raise_for_status()
+    return _parse_gplay_detail(response.text)
+
+
+def _fetch_gplay_games_http():
+    """브라우저 없이 HTTP로 Google Play 사전등록 게임 목록을 가져옵니다. (제너레이터)
+
+    모든 컬렉션 / 로케일의 후보를 추출하는 대로 상세 페이지를 조회하고, 판정이 끝난 게임을 후보 순서대로 돌려줍니다.
+    여러 컬렉션에 있는 앱은 처음 나온 곳에서 한 번만 확인합니다.
+    """
+    clock = PhaseClock()
+    seen_ids = set()
+
+    def iter_candidates():
+        # 컬렉션을 하나씩 받아 파싱하는 동안 앞 컬렉션 후보의 상세 조회가 진행됨
+        for url, locale in gplay_listings():
+            print(f"[Google Play] 페이지 로드 중... (HTTP, {_gplay_listing_label(url, locale)})")
+            response = http_get(url, headers={"Accept-Language": locale})
+            response.raise_for_status()
+            clock.lap("listing")
+            yield from _parse_gplay_collection(response.text, seen_ids)
+
+    checked = set()
+    saved = saved_lookup("gplay")
+
+    def lookup(app: dict) -> dict | None:
+        cached = enrich_cache.get("gplay", app["id"])
+        if cached is None:
+            checked.add(app["id"])
+        return cached
+
+    candidates = 0
+    extracted = 0
+    count = 0
+    for app, result in stream_map(_fetch_gplay_detail_http, iter_candidates(), lookup):
+        candidates += 1
+        if app["id"] in checked:
+            if isinstance(result, dict):
+                extracted += 1
+                enrich_cache.put("gplay", app["id"], result)
+            elif isinstance(result, (req.RequestException, CircuitOpen)):
+                # 요청 실패는 만료된 이전 판정이라도 유지, 캐시에도 없으면 저장된 목록에 있던 앱은 그대로 유지
+                result = _gplay_fallback_result(app["id"], saved)
+            else:
+                result = None
+        if _accept_gplay_app(app, result):
+            count += 1
+            yield app
+    check_deadline()
+    if not candidates:
+        raise GplayExtractionError("컬렉션 페이지에서 앱을 찾지 못함")
+    if checked and not extracted:
+        raise GplayExtractionError("상세 페이지에서 구조화 데이터를 찾지 못함")
+    clock.lap("detail")
+    print(f"[Google Play] 총 {count}개 게임 발견 (후보 {candidates}개, 상세 확인 {len(checked)}개)\n")
+
+
+def fetch_gplay_games():
+    """Google Play에서 사전등록 게임 목록을 가져옵니다. 수집 방식은 GPLAY_MODE를 따릅니다. (제너레이터)
+
+    HTTP 수집이 도중에 실패해 브라우저로 전환하면 이미 돌려준 게임은 다시 돌려주지 않습니다.
+    HTTP는 컬렉션의 첫 묶음만 볼 수 있으므로, auto 모드에서 찾은 게임이 저장된 목록보다 눈에 띄게 적으면
+    (GPLAY_HTTP_MIN_RATIO) 브라우저로 스크롤해 나머지를 찾습니다.
+    """
+    emitted = set()
+    if GPLAY_MODE in ("auto", "http"):
+        try:
+            for app in _fetch_gplay_games_http():
+                emitted.add(app["id"])
+                yield app
+            saved_count = len(load_saved(SOURCES["gplay"][2]))
+            if GPLAY_MODE == "http" or len(emitted) >= saved_count * GPLAY_HTTP_MIN_RATIO:
+                return
+            print(f"[Google Play] HTTP로 {len(emitted)}개만 발견 (저장된 목록 {saved_count}개), 브라우저로 나머지 확인")
+        except (req.RequestException, CircuitOpen, GplayExtractionError) as e:
+            if GPLAY_MODE == "http":
+                raise
+            print(f"[Google Play] HTTP 수집 실패 ({e}), 브라우저로 전환")
+    for app in _fetch_gplay_games_browser():
+        if app["id"] not in emitted:
+            yield app
+
+
+class WarmBrowser:
+    """여러 번의 실행에 걸쳐 Chromium 하나를 재사용합니다. max_uses번 쓰면 메모리 정리를 위해 새로 띄웁니다.
+
+    Playwright 동기 API는 만든 스레드에서만 쓸 수 있으므로 한 스레드 안에서만 사용합니다.
+    """
+
+    def __init__(self, max_uses: int):
+        self.max_uses = max_uses
+        self._playwright = None
+        self._browser = None
+        self._uses = 0
+
+    def get(self):
+        if self._browser is not None and (self._uses >= self.max_uses or not self._browser.is_connected()):
+            print(f"[Google Play] 브라우저 재시작 ({self._uses}회 사용)")
+            self._close_browser()
+        if self._browser is None:
+            if self._playwright is None:
+                self._playwright = _playwright.sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=True)
+            self._uses = 0
+        self._uses += 1
+        return self._browser
+
+    def _close_browser(self) -> None:
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+    def close(self) -> None:
+        self._close_browser()
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+
+# 현재 스레드가 가진 WarmBrowser (감시 모드의 브라우저 전용 스레드에서만 설정)
+_browser_local = threading.local()
+
+
+@contextmanager
+def gplay_browser():
+    """현재 스레드에 재사용 중인 브라우저가 있으면 그것을, 없으면 이번 실행용 브라우저를 띄워 돌려줍니다."""
+    warm = getattr(_browser_local, "warm", None)
+    if warm is not None:
+        browser = warm.get()
+        try:
+            yield browser
+        finally:
+            # 중단된 실행이 남긴 컨텍스트까지 정리해 다음 실행에 넘기지 않음
+            for context in browser.contexts:
+                context.close()
+        return
+    with _playwright.sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            yield browser
+        finally:
+            browser.close()
+
+
+def _load_gplay_listing(page, url: str, clock: PhaseClock) -> list[dict]:
+    """컬렉션 페이지를 열고 끝까지 스크롤한 뒤 앱 링크({href, text, alt}) 목록을 반환합니다."""
+    try:
+        page.goto(resolve_page_url(url), timeout=60000)
+        page.wait_for_load_state("networkidle", timeout=30000)
+    except _playwright.TimeoutError:
+        print("  페이지 로드 타임아웃, 계속 진행...")
+    clock.lap("load")
+
+    # 스크롤: 고정 대기 대신 페이지 높이가 늘어날 때까지만 기다림
+    for i in range(20):
+        check_deadline()
+        height = page.evaluate("() => { window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight; }")
+        try:
+            page.wait_for_function("h => document.body.scrollHeight > h", arg=height, timeout=3000)
+        except _playwright.TimeoutError:
+            break
+    clock.lap("scroll")
+
+    # 앱 링크 추출 (한 번의 evaluate로 href / 텍스트 / 이미지 alt를 모두 가져옴)
+    return page.eval_on_selector_all(
+        "a[href*='/store/apps/details']",
+        """els => els.map(a => {
+            const img = a.querySelector('img');
+            return {href: a.getAttribute('href'), text: a.innerText, alt: img ? (img.getAttribute('alt') || '') : null};
+        })""",
+    )
+
+
+def _fetch_gplay_games_browser():
+    """Playwright로 Google Play 사전등록 게임 목록을 가져옵니다. (제너레이터)
+
+    브라우저 하나에서 로케일별 컨텍스트로 모든 컬렉션을 읽고, 컬렉션 간 중복을 없앤 후보만 상세 확인합니다.
+    상세 확인이 끝나는 대로 판정이 끝난 앞쪽 후보부터 순서대로 돌려줍니다.
+    """
+    clock = PhaseClock()
+    count = 0
+
+    with gplay_browser() as browser:
+        # 로케일마다 컨텍스트 하나를 만들어 그 로케일의 모든 컬렉션에 재사용
+        source_key = current_source()
+        pages = {}
+        for locale in GPLAY_LOCALES:
+            context = browser.new_context(
+                locale=locale,
+                viewport={"width": 1920, "height": 1080},
+                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            )
+            context.on("response", lambda r: metrics.add_request(source_key, int(r.headers.get("content-length") or 0)))
+            if browser_context_hook:
+                browser_context_hook(context)
+            pages[locale] = context.new_page()
+        clock.lap("launch")
+
+        candidates = []
+        seen_ids = set()
+        for url, locale in gplay_listings():
+            check_deadline()
+            print(f"[Google Play] 페이지 로드 중... ({_gplay_listing_label(url, locale)})")
+            links = _load_gplay_listing(pages[locale], url, clock)
+            candidates.extend(_collect_gplay_candidates(links, seen_ids))
+            clock.lap("collect")
+
+        # 상세 확인은 첫 번째 로케일의 컨텍스트에서 진행
+        page = pages[GPLAY_LOCALES[0]]
+        context = page.context
+
+        # 게임 카테고리 + 한국 개발사 필터링 (캐시에 없거나 만료된 후보만 상세 페이지 확인)
+        results = {}
+        to_check = []
+        saved = saved_lookup("gplay")
+        for app in candidates:
+            cached = enrich_cache.get("gplay", app["id"])
+            if cached is None:
+                to_check.append(app)
+            else:
+                results[app["id"]] = cached
+        print(f"[Google Play] 한국 개발사 게임 필터링 중... (후보 {len(candidates)}개, 상세 확인 {len(to_check)}개)")
+
+        pool_size = max(1, min(GPLAY_DETAIL_CONCURRENCY, len(to_check)))
+        free_pages = deque([page] + [context.new_page() for _ in range(pool_size - 1)])
+        for detail_page in free_pages:
+            detail_page.route("**/*", _block_heavy_resources)
+        in_flight = deque()
+        pending = iter(to_check)
+        done = set(results)
+        next_emit = 0
+
+        # 빈 페이지마다 다음 후보의 로드를 시작해 두고, 시작한 순서대로 결과를 확인
+        while True:
+            # 앞에서부터 판정이 끝난 후보는 바로 내보냄 (후보 순서 유지)
+            while next_emit < len(candidates) and candidates[next_emit]["id"] in done:
+                app = candidates[next_emit]
+                next_emit += 1
+                if _accept_gplay_app(app, results.get(app["id"])):
+                    count += 1
+                    yield app
+
+            while free_pages:
+                app = next(pending, None)
+                if app is None:
+                    break
+                detail_page = free_pages.popleft()
+                in_flight.append((detail_page, app, _start_gplay_detail(detail_page, app)))
+
+            if not in_flight:
+                break
+
+            check_deadline()
+            detail_page, app, started_at = in_flight.popleft()
+            result = _check_gplay_detail(detail_page, app, started_at) if started_at is not None else None
+            if result is not None:
+                enrich_cache.put("gplay", app["id"], result)
+                results[app["id"]] = result
+            else:
+                # 로드 실패 / 타임아웃은 이전 판정 또는 저장된 목록 기준으로 유지
+                results[app["id"]] = _gplay_fallback_result(app["id"], saved)
+            done.add(app["id"])
+            free_pages.append(detail_page)
+        clock.lap("detail")
+
+    print(f"[Google Play] 총 {count}개 게임 발견\n")
+
+
+# ──────────────────────────────────────────────
+# 인벤 사전예약 크롤링
+# ──────────────────────────────────────────────
+
+def _fetch_inven_developer(url: str) -> str | None:
+    """인벤 캠페인 상세 페이지에서 개발사를 추출합니다. 없으면 None."""
+    detail_resp = http_get(url, timeout=HTTP_DETAIL_TIMEOUT)
+    detail_resp.raise_for_status()
+    detail_soup = parse_html(detail_resp.text, "div", ["information"])
+    company_elem = detail_soup.select_one("div.information > p.company")
+    if not company_elem:
+        return None
+    # p.company에 개발사 + 출시일이 함께 있을 수 있으므로 첫 번째 텍스트 노드만 추출
+    return next(company_elem.stripped_strings, None)
+
+
+def _iter_inven_items(soup):
+    """인벤 목록에서 사전예약 캠페인 항목을 하나씩 추출합니다. (제너레이터)"""
     items = soup.select("li.item a[href*='/campaign/']")
 
     for item in items:
@@ -200,66 +1562,71 @@ def fetch_inven_games() -> list[dict]:
             reward_elem = item.select_one("p.sreward")
             reward = reward_elem.get_text(strip=True) if reward_elem else ""
 
-            games.append({
-                "id": campaign_id,
-                "title": title,
-                "url": url,
-                "release_date": release_date,
-                "reward": reward,
-            })
-            print(f"  + {title} ({release_date})")
-
         except Exception:
             continue
 
-    # 상세 페이지에서 개발사 정보 추출
-    for game in games:
-        try:
-            detail_resp = req.get(
-                game["url"],
-                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
-                timeout=10
-            )
-            detail_resp.raise_for_status()
-            detail_soup = BeautifulSoup(detail_resp.text, "html.parser")
-            company_elem = detail_soup.select_one("div.information > p.company")
-            if company_elem:
-                # p.company에 개발사 + 출시일이 함께 있을 수 있으므로 첫 번째 텍스트 노드만 추출
-                developer = list(company_elem.stripped_strings)[0] if company_elem.stripped_strings else ""
-                game["developer"] = developer
-                print(f"  [개발사] {game['title']} → {developer}")
-        except Exception:
-            continue
+        print(f"  + {title} ({release_date})")
+        yield GameRecord(
+            id=campaign_id,
+            title=title,
+            url=url,
+            release_date=release_date,
+            reward=reward,
+        )
 
-    print(f"[인벤] 총 {len(games)}개 게임 발견\n")
-    return games
+
+def fetch_inven_games():
+    """인벤에서 사전예약 게임 목록을 가져옵니다. 개발사까지 채운 레코드를 하나씩 돌려줍니다. (제너레이터)"""
+    print(f"[인벤] 페이지 로드 중...")
+    clock = PhaseClock()
+    try:
+        response = fetch_listing("inven", INVEN_URL)
+        response.raise_for_status()
+    except req.RequestException as e:
+        print(f"[인벤] 페이지 로드 실패: {e}")
+        raise
+    clock.lap("listing")
+
+    # 목록 HTML은 한 번에 트리로 만들고(대상 li 하위 트리만), 그 뒤의 항목 추출과 상세 조회를 겹쳐 진행
+    soup = parse_html(response.text, "li", ["item"])
+    clock.lap("parse")
+
+    # 항목을 추출하는 대로 상세 페이지에서 개발사 정보 조회
+    count = 0
+    for game in enrich_stream("inven", _iter_inven_items(soup), _fetch_inven_developer):
+        count += 1
+        yield game
+    clock.lap("detail")
+
+    print(f"[인벤] 총 {count}개 게임 발견\n")
 
 
 # ──────────────────────────────────────────────
 # 카카오게임즈 크롤링
 # ──────────────────────────────────────────────
 
-def fetch_kakao_games() -> list[dict]:
+def fetch_kakao_games() -> list[GameRecord]:
     """카카오게임즈에서 사전예약 게임 목록을 가져옵니다."""
     games = []
 
     print("[카카오게임즈] 페이지 로드 중...")
+    clock = PhaseClock()
     try:
-        response = req.get(
+        response = fetch_listing(
+            "kakao",
             "https://game.kakao.com/pr/ajax/list",
             headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "X-Requested-With": "XMLHttpRequest",
                 "Referer": "https://game.kakao.com/pr",
             },
-            timeout=15
         )
         response.raise_for_status()
     except req.RequestException as e:
         print(f"[카카오게임즈] 페이지 로드 실패: {e}")
-        return games
+        raise
+    clock.lap("listing")
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = parse_html(response.text, "li", ["js-ar-item", "js-pr-item"])
 
     # 사전예약 항목 추출
     items = soup.select("li.js-ar-item, li.js-pr-item")
@@ -290,16 +1657,18 @@ def fetch_kakao_games() -> list[dict]:
             # URL
             url = href if href.startswith("http") else f"https://game.kakao.com{href}"
 
-            games.append({
-                "id": game_id,
-                "title": title,
-                "url": url,
-            })
+            games.append(GameRecord(
+                id=game_id,
+                title=title,
+                url=url,
+            ))
             print(f"  + {title}")
 
         except Exception:
             continue
 
+    clock.lap("parse")
+
     print(f"[카카오게임즈] 총 {len(games)}개 게임 발견\n")
     return games
 
@@ -308,166 +1677,734 @@ def fetch_kakao_games() -> list[dict]:
 # 원스토어 크롤링
 # ──────────────────────────────────────────────
 
-def fetch_onestore_games() -> list[dict]:
-    """원스토어에서 사전예약 게임 목록을 가져옵니다."""
-    games = []
-
-    print("[원스토어] 페이지 로드 중...")
-    try:
-        response = req.get(
-            ONESTORE_URL,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
-            timeout=15
-        )
-        response.raise_for_status()
-    except req.RequestException as e:
-        print(f"[원스토어] 페이지 로드 실패: {e}")
-        return games
-
-    import urllib.parse
-    decoded = urllib.parse.unquote(response.text)
-    # RSC 데이터의 이스케이프된 따옴표 처리
-    cleaned = decoded.replace('\\"', '"')
-
-    # prodId + prodName 쌍 추출
-    pattern = r'"prodId":"(\d+)","prodName":"([^"]+)"'
-    matches = re.findall(pattern, cleaned)
-
+ONESTORE_PRODUCT_PATTERN = re.compile(r'"prodId":"(\d+)","prodName":"([^"]+)"')
+ONESTORE_SELLER_PATTERN = re.compile(r'"sellerName":"([^"]+)"')
+
+# RSC 스트림을 읽는 조각 크기와, 조각 경계에 걸친 레코드를 위해 남겨 두는 최대 길이
+RSC_CHUNK_SIZE = 64 * 1024
+RSC_CARRY_SIZE = 8 * 1024
+
+
+def iter_rsc_matches(chunks, pattern: re.Pattern):
+    """RSC(React Server Components) 응답 조각을 순서대로 읽으며 pattern에 맞는 그룹을 돌려줍니다.
+
+    전체 본문을 unquote + 따옴표 복원한 것과 같은 결과를 내지만, 조각 단위로 처리해
+    본문 전체 크기의 사본을 만들지 않습니다.
+    """
+    from urllib.parse import unquote_to_bytes
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = b""
+    held = ""
+    carry = ""
+    for chunk in itertools.chain(chunks, [None]):
+        final = chunk is None
+        data = pending + (chunk or b"")
+        pending = b""
+        if not final:
+            # 조각 끝에 잘린 %XX는 다음 조각과 합쳐서 디코딩
+            pct = data.rfind(b"%", len(data) - 2)
+            if pct != -1:
+                data, pending = data[:pct], data[pct:]
+        piece = held + decoder.decode(unquote_to_bytes(data), final=final)
+
+        # RSC 데이터의 이스케이프된 따옴표 처리 (끝의 백슬래시는 다음 조각과 합침).
+        # carry는 이미 치환을 마친 텍스트이므로 새로 읽은 부분에만 한 번 적용
+        held = ""
+        if not final and piece.endswith("\\"):
+            piece, held = piece[:-1], "\\"
+        text = carry + piece.replace('\\"', '"')
+
+        last_end = 0
+        for match in pattern.finditer(text):
+            yield match.groups()
+            last_end = match.end()
+        carry = text[max(last_end, len(text) - RSC_CARRY_SIZE):]
+
+
+def _fetch_onestore_developer(url: str) -> str | None:
+    """원스토어 상품 상세 페이지에서 판매자(개발사)를 추출합니다. 없으면 None.
+
+    sellerName을 찾는 즉시 나머지 본문은 읽지 않고 연결을 닫습니다.
+    """
+    with http_get(url, timeout=HTTP_DETAIL_TIMEOUT, stream=True) as detail_resp:
+        detail_resp.raise_for_status()
+        chunks = count_bytes(detail_resp.iter_content(RSC_CHUNK_SIZE))
+        for (seller_name,) in iter_rsc_matches(chunks, ONESTORE_SELLER_PATTERN):
+            return seller_name
+    return None
+
+
+def _iter_onestore_items(response):
+    """원스토어 목록 응답에서 prodId + prodName 쌍을 중복 없이 하나씩 추출합니다. (제너레이터)"""
     seen_ids = set()
-    for prod_id, prod_name in matches:
+    for prod_id, prod_name in iter_rsc_matches(response.iter_content(RSC_CHUNK_SIZE), ONESTORE_PRODUCT_PATTERN):
         if prod_id in seen_ids:
             continue
         seen_ids.add(prod_id)
+        print(f"  + {prod_name}")
+        yield GameRecord(
+            id=prod_id,
+            title=prod_name,
+            url=f"https://m.onestore.co.kr/v2/ko-kr/event/preregistrations/{prod_id}",
+        )
 
-        url = f"https://m.onestore.co.kr/v2/ko-kr/event/preregistrations/{prod_id}"
 
-        games.append({
-            "id": prod_id,
-            "title": prod_name,
-            "url": url,
-        })
-        print(f"  + {prod_name}")
+def fetch_onestore_games():
+    """원스토어에서 사전예약 게임 목록을 가져옵니다. 개발사까지 채운 레코드를 하나씩 돌려줍니다. (제너레이터)"""
+    print("[원스토어] 페이지 로드 중...")
+    clock = PhaseClock()
+    try:
+        response = fetch_listing("onestore", ONESTORE_URL)
+        response.raise_for_status()
+    except req.RequestException as e:
+        print(f"[원스토어] 페이지 로드 실패: {e}")
+        raise
+    clock.lap("listing")
 
-    # 상세 페이지에서 개발사 정보 추출
-    for game in games:
-        try:
-            detail_resp = req.get(
-                game["url"],
-                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
-                timeout=10
-            )
-            detail_resp.raise_for_status()
-            detail_decoded = urllib.parse.unquote(detail_resp.text)
-            detail_cleaned = detail_decoded.replace('\\"', '"')
-            seller_match = re.search(r'"sellerName":"([^"]+)"', detail_cleaned)
-            if seller_match:
-                game["developer"] = seller_match.group(1)
-                print(f"  [개발사] {game['title']} → {game['developer']}")
-        except Exception:
-            continue
+    # 항목을 추출하는 대로 상세 페이지에서 개발사 정보 조회 (목록 파싱과 상세 조회가 겹침)
+    count = 0
+    for game in enrich_stream("onestore", _iter_onestore_items(response), _fetch_onestore_developer):
+        count += 1
+        yield game
+    clock.lap("detail")
 
-    print(f"[원스토어] 총 {len(games)}개 게임 발견\n")
-    return games
+    print(f"[원스토어] 총 {count}개 게임 발견\n")
 
 
 # ──────────────────────────────────────────────
 # 네이버게임 크롤링
 # ──────────────────────────────────────────────
 
-def fetch_naver_games() -> list[dict]:
-    """네이버게임에서 이번 달 출시 게임 목록을 가져옵니다."""
-    games = []
-
-    today = datetime.now().strftime("%Y-%m-%d")
-    print(f"[네이버게임] 이번 달 출시 게임 조회 중... (기준일: {today})")
-
-    try:
-        response = req.get(
+def _naver_search_dates(months_ahead: int) -> list[str]:
+    """오늘 날짜와 이후 months_ahead개월의 1일을 조회 기준일로 반환합니다."""
+    today = datetime.now()
+    dates = [today.strftime("%Y-%m-%d")]
+    year, month = today.year, today.month
+    for _ in range(months_ahead):
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        dates.append(f"{year:04d}-{month:02d}-01")
+    return dates
+
+
+def _iter_naver_pages(search_date: str, digest):
+    """기준일의 출시 목록을 offset으로 끝까지 넘기며 항목을 하나씩 돌려줍니다. 받은 본문은 digest에 반영합니다."""
+    offset = 0
+    while True:
+        check_deadline()
+        response = http_get(
             NAVER_API_URL,
-            params={"count": 100, "offset": 0, "searchDate": today},
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
-            timeout=15
+            params={"count": NAVER_PAGE_SIZE, "offset": offset, "searchDate": search_date},
         )
         response.raise_for_status()
+        digest.update(response.content)
+        page = response.json().get("content", {}).get("launchGameList", [])
+        yield from page
+        if len(page) < NAVER_PAGE_SIZE:
+            return
+        offset += NAVER_PAGE_SIZE
+
+
+def _parse_naver_item(item: dict) -> GameRecord | None:
+    game_id = item.get("gameId", "")
+    game_name = item.get("gameName", "")
+    if not game_id or not game_name:
+        return None
+
+    landing_url = item.get("landingUrl", "")
+    if landing_url and not landing_url.startswith("http"):
+        landing_url = f"https://game.naver.com{landing_url}"
+
+    release_type = item.get("releaseType", "")
+    schedule = item.get("schedule", "")
+    platform = item.get("platform", "")
+
+    release_info = ""
+    if release_type and schedule:
+        release_info = f"{schedule} {release_type}"
+    elif schedule:
+        release_info = schedule
+
+    return GameRecord(
+        id=game_id,
+        title=game_name,
+        url=landing_url,
+        release_date=release_info,
+        platform=platform,
+    )
+
+
+def fetch_naver_games(months_ahead: int | None = None):
+    """네이버게임에서 출시 게임 목록을 받아오는 대로 하나씩 돌려줍니다. (제너레이터)
+
+    이번 달은 목록이 끝날 때까지 페이지를 넘기며, 다음 months_ahead개월은 동시에 미리 받아 둡니다.
+    """
+    months_ahead = NAVER_MONTHS_AHEAD if months_ahead is None else months_ahead
+    dates = _naver_search_dates(months_ahead)
+    print(f"[네이버게임] 출시 게임 조회 중... (기준일: {', '.join(dates)})")
+    clock = PhaseClock()
+
+    digests = [hashlib.sha256() for _ in dates]
+    prefetched = [
+        background_iter(lambda d=d, h=h: _iter_naver_pages(d, h), NAVER_PAGE_SIZE * 2)
+        for d, h in zip(dates[1:], digests[1:])
+    ]
+    streams = [_iter_naver_pages(dates[0], digests[0])] + prefetched
+
+    seen_ids = set()
+    try:
+        for item in itertools.chain.from_iterable(streams):
+            game = _parse_naver_item(item)
+            if game is None or game["id"] in seen_ids:
+                continue
+            seen_ids.add(game["id"])
+            print(f"  + {game['title']} ({game['release_date']} / {game['platform']})")
+            yield game
     except req.RequestException as e:
         print(f"[네이버게임] API 호출 실패: {e}")
-        return games
-
-    data = response.json()
-    game_list = data.get("content", {}).get("launchGameList", [])
-
-    for item in game_list:
-        game_id = item.get("gameId", "")
-        game_name = item.get("gameName", "")
-        if not game_id or not game_name:
-            continue
-
-        landing_url = item.get("landingUrl", "")
-        if landing_url and not landing_url.startswith("http"):
-            landing_url = f"https://game.naver.com{landing_url}"
-
-        release_type = item.get("releaseType", "")
-        schedule = item.get("schedule", "")
-        platform = item.get("platform", "")
-
-        release_info = ""
-        if release_type and schedule:
-            release_info = f"{schedule} {release_type}"
-        elif schedule:
-            release_info = schedule
-
-        games.append({
-            "id": game_id,
-            "title": game_name,
-            "url": landing_url,
-            "release_date": release_info,
-            "platform": platform,
-        })
-        print(f"  + {game_name} ({release_info} / {platform})")
+        raise
+    finally:
+        # 앞 달에서 실패하거나 소비를 멈추면 아직 읽지 않은 달의 생산 스레드도 멈춤
+        for stream in prefetched:
+            stream.close()
+    clock.lap("fetch")
 
-    print(f"[네이버게임] 총 {len(games)}개 게임 발견\n")
-    return games
+    print(f"[네이버게임] 총 {len(seen_ids)}개 게임 발견\n")
+    combined = hashlib.sha256("".join(h.hexdigest() for h in digests).encode()).hexdigest()
+    check_listing_digest("naver", f"{NAVER_API_URL}?months={len(dates)}", combined)
 
 
 # ──────────────────────────────────────────────
 # 공통 유틸
 # ──────────────────────────────────────────────
 
-def load_saved(filepath: Path) -> list[dict]:
-    """저장된 게임 목록을 불러옵니다."""
+def load_snapshot(filepath: Path) -> dict:
+    """저장된 스냅샷 파일 전체를 불러옵니다."""
     if not filepath.exists():
-        return []
+        return {}
     try:
         with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("games", [])
+            return json.load(f)
     except (json.JSONDecodeError, IOError):
-        return []
+        return {}
+
+
+def load_saved(filepath: Path) -> list[GameRecord]:
+    """저장된 게임 목록을 불러옵니다."""
+    return [GameRecord(g) for g in load_snapshot(filepath).get("games", [])]
+
+
+def record_fingerprint(game: dict) -> str:
+    """게임 레코드 내용의 지문을 만듭니다. 필드 값이 하나라도 바뀌면 달라집니다."""
+    payload = json.dumps(game, ensure_ascii=False, sort_keys=True, default=_json_default)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
 
 
-def save_games(filepath: Path, games: list[dict]) -> None:
-    """게임 목록을 저장합니다."""
+def save_games(filepath: Path, games: list[dict]) -> bool:
+    """게임 목록을 저장합니다. 레코드 지문이 이전과 모두 같으면 파일을 다시 쓰지 않고 False를 반환합니다."""
+    fingerprints = {g["id"]: record_fingerprint(g) for g in games}
+    if load_snapshot(filepath).get("fingerprints") == fingerprints:
+        return False
+
     data = {
         "updated_at": datetime.now().isoformat(),
         "count": len(games),
         "games": games,
+        "fingerprints": fingerprints,
     }
     with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        json.dump(data, f, ensure_ascii=False, indent=2, default=_json_default)
+    return True
+
+
+def diff_games(current, saved: list[dict]) -> dict:
+    """이전 목록과 비교해 추가 / 삭제 / 변경된 레코드를 분류합니다.
+
+    current는 리스트 또는 레코드를 하나씩 돌려주는 이터레이터이며, 받는 대로 비교합니다.
+    modified 항목은 {"game": 현재 레코드, "changes": {필드: (이전 값, 현재 값)}} 형태이고,
+    결과의 "current"에는 받은 레코드 전체가 순서대로 들어갑니다.
+    """
+    saved_by_id = {g["id"]: g for g in saved}
+    current_list, current_ids = [], set()
+    added, modified = [], []
+    for game in current:
+        current_list.append(game)
+        current_ids.add(game["id"])
+        before = saved_by_id.get(game["id"])
+        if before is None:
+            added.append(game)
+        elif record_fingerprint(before) != record_fingerprint(game):
+            changes = {
+                field: (before.get(field), game.get(field))
+                for field in sorted(set(before) | set(game))
+                if before.get(field) != game.get(field)
+            }
+            modified.append({"game": game, "changes": changes})
+    removed = [g for g in saved if g["id"] not in current_ids]
+    return {"current": current_list, "added": added, "removed": removed, "modified": modified}
+
+
+# ──────────────────────────────────────────────
+# 상태 저장소 (SQLite)
+# ──────────────────────────────────────────────
+
+class StateStore:
+    """(source, id)를 키로 게임 상태와 처음/마지막 발견 시각을 보관하는 SQLite 저장소입니다."""
+
+    # IN 절 하나에 넣는 최대 ID 수 (SQLite 변수 개수 제한)
+    QUERY_CHUNK = 500
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS games (
+                source     TEXT NOT NULL,
+                id         TEXT NOT NULL,
+                data       TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen  TEXT NOT NULL,
+                present    INTEGER NOT NULL DEFAULT 1,
+                PRIMARY KEY (source, id)
+            );
+            CREATE INDEX IF NOT EXISTS games_present ON games (source, present);
+        """)
+
+    def count(self, source: str) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM games WHERE source = ?", (source,)).fetchone()
+        return row[0]
+
+    def find_new(self, source: str, current: list[dict]) -> list[dict]:
+        """한 번도 기록된 적 없는 게임만 반환합니다. (기본 키 인덱스 조회)"""
+        ids = [g["id"] for g in current]
+        known = set()
+        with self._lock:
+            for i in range(0, len(ids), self.QUERY_CHUNK):
+                chunk = ids[i:i + self.QUERY_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT id FROM games WHERE source = ? AND id IN ({','.join('?' * len(chunk))})",
+                    [source, *chunk],
+                )
+                known.update(row[0] for row in rows)
+        return [g for g in current if g["id"] not in known]
+
+    def upsert(self, source: str, games: list[dict], seen_at: str | None = None) -> None:
+        """현재 목록을 반영합니다. 목록에서 빠진 게임은 present=0으로 표시합니다."""
+        seen_at = seen_at or datetime.now().isoformat()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO games (source, id, data, first_seen, last_seen, present)
+                VALUES (?, ?, ?, ?, ?, 1)
+                ON CONFLICT (source, id) DO UPDATE SET
+                    data = excluded.data, last_seen = excluded.last_seen, present = 1
+                """,
+                [(source, g["id"], json.dumps(g, ensure_ascii=False, default=_json_default), seen_at, seen_at) for g in games],
+            )
+            self._conn.execute(
+                "UPDATE games SET present = 0 WHERE source = ? AND present = 1 AND last_seen < ?",
+                (source, seen_at),
+            )
+
+    def history(self, source: str) -> list[dict]:
+        """소스의 전체 이력(현재 목록에서 빠진 게임 포함)을 처음 발견 순으로 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data, first_seen, last_seen, present FROM games WHERE source = ? ORDER BY first_seen, id",
+                (source,),
+            ).fetchall()
+        return [
+            {**json.loads(data), "first_seen": first_seen, "last_seen": last_seen, "present": bool(present)}
+            for data, first_seen, last_seen, present in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+state_store: StateStore | None = None
+
+
+# ──────────────────────────────────────────────
+# 스냅샷 보관소 (열 단위 압축, 덧붙이기 전용)
+# ──────────────────────────────────────────────
+
+class SnapshotArchive:
+    """소스별 목록 스냅샷을 필드(열) 단위로 압축해 끝에 덧붙이는 보관소입니다.
+
+    segments.bin에는 스냅샷마다 필드별 값 배열(JSON)을 zlib으로 압축한 블록을 이어 쓰고,
+    index.jsonl에는 한 줄에 스냅샷 하나씩 소스, 시각, 건수, 필드별 블록 위치를 적습니다.
+    조회할 때는 색인으로 기간과 소스를 고른 뒤 필요한 필드의 블록만 읽어 풉니다.
+    값이 None인 필드는 복원할 때 없는 필드가 됩니다.
+    """
+
+    DATA_NAME = "segments.bin"
+    INDEX_NAME = "index.jsonl"
+    COLUMNS = GameRecord.FIELDS + ("extra",)
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._entries: list[dict] | None = None
+
+    def entries(self) -> list[dict]:
+        """색인 항목 전체를 기록 순서대로 반환합니다. 쓰다 끊긴 줄은 건너뜁니다."""
+        with self._lock:
+            if self._entries is None:
+                self._entries = []
+                index_path = self.directory / self.INDEX_NAME
+                if index_path.exists():
+                    with open(index_path, "r", encoding="utf-8") as f:
+                        for line in f:
+                            try:
+                                self._entries.append(json.loads(line))
+                            except json.JSONDecodeError:
+                                continue
+            return self._entries
+
+    def latest(self, source: str) -> dict | None:
+        for entry in reversed(self.entries()):
+            if entry["source"] == source:
+                return entry
+        return None
+
+    def append(self, source: str, games: list, taken_at: str | None = None) -> dict:
+        """목록을 스냅샷으로 덧붙입니다. 블록을 디스크에 쓴 뒤에 색인 줄을 씁니다."""
+        records = [g if isinstance(g, GameRecord) else GameRecord(g) for g in games]
+        entry = {
+            "source": source,
+            "taken_at": taken_at or datetime.now().isoformat(timespec="seconds"),
+            "count": len(records),
+            "columns": {},
+        }
+        blocks = []
+        for field in self.COLUMNS:
+            values = [r.extra if field == "extra" else getattr(r, field, None) for r in records]
+            if any(v is not None for v in values):
+                payload = json.dumps(values, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                blocks.append((field, zlib.compress(payload)))
+
+        entries = self.entries()
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / self.DATA_NAME, "ab") as f:
+                offset = f.tell()
+                for field, block in blocks:
+                    entry["columns"][field] = [offset, len(block)]
+                    f.write(block)
+                    offset += len(block)
+                f.flush()
+                os.fsync(f.fileno())
+
+            index_path = self.directory / self.INDEX_NAME
+            with open(index_path, "a+b") as f:
+                # 이전 실행이 줄 중간에서 끊겼으면 새 줄에서 시작
+                line = json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n"
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line
+                f.write(line)
+            entries.append(entry)
+        return entry
+
+    def iter_columns(self, entries: list[dict], fields=("id",)):
+        """스냅샷마다 (색인 항목, {필드: 값 목록})을 돌려줍니다. 요청한 필드의 블록만 읽습니다. (제너레이터)"""
+        with open(self.directory / self.DATA_NAME, "rb") as f:
+            for entry in entries:
+                columns = {}
+                for field in fields:
+                    if field not in entry["columns"]:
+                        columns[field] = [None] * entry["count"]
+                        continue
+                    offset, length = entry["columns"][field]
+                    f.seek(offset)
+                    columns[field] = json.loads(zlib.decompress(f.read(length)))
+                yield entry, columns
+
+    def load(self, entry: dict) -> list[GameRecord]:
+        """스냅샷 하나를 GameRecord 목록으로 복원합니다."""
+        _, columns = next(self.iter_columns([entry], self.COLUMNS))
+        records = []
+        for i in range(entry["count"]):
+            record = GameRecord({field: columns[field][i] for field in GameRecord.FIELDS
+                                 if columns[field][i] is not None})
+            record.update(columns["extra"][i] or {})
+            records.append(record)
+        return records
+
+
+snapshot_archive = SnapshotArchive(ARCHIVE_DIR)
+
+
+def _period_days(since: str, until: str) -> tuple[date, date]:
+    """since / until(포함)을 첫날과 마지막 날로 바꿉니다."""
+    start = datetime.strptime(since if len(since) == 10 else f"{since}-01", "%Y-%m-%d").date()
+    if len(until) == 10:
+        end = datetime.strptime(until, "%Y-%m-%d").date()
+    else:
+        first = datetime.strptime(f"{until}-01", "%Y-%m-%d").date()
+        end = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return start, end
+
+
+def _period_labels(since: str, until: str, by: str) -> list[str]:
+    start, end = _period_days(since, until)
+    labels = []
+    day = start
+    while day <= end:
+        label = day.isoformat() if by == "day" else day.isoformat()[:7]
+        if not labels or labels[-1] != label:
+            labels.append(label)
+        day += timedelta(days=1)
+    return labels
+
+
+def query_archive(archive: SnapshotArchive, keys: list[str], since: str | None = None,
+                  until: str | None = None, by: str = "month") -> list[dict]:
+    """기간(일 / 월)별, 소스별로 목록에 있던 게임 수와 새로 나타난 게임 수를 셉니다.
+
+    스냅샷은 목록이 바뀔 때만 쌓이므로, 기간 시작 시점에 유효한 스냅샷(그 이전의 마지막 스냅샷)도
+    그 기간에 포함합니다. 신규는 조회 구간 안에서 처음 나타난 게임이며, 구간 시작 전의 마지막 스냅샷을
+    기준으로 합니다. 색인으로 스냅샷을 고른 뒤 id 열만 읽습니다.
+    """
+    entries = [e for e in archive.entries() if e["source"] in keys]
+    if not entries:
+        return []
+    width = 10 if by == "day" else 7
+    since = since or entries[0]["taken_at"][:width]
+    until = until or datetime.now().isoformat()[:width]
+    labels = _period_labels(since, until, by)
+
+    rows = []
+    for key in keys:
+        source_entries = [e for e in entries if e["source"] == key]
+        before = [e for e in source_entries if e["taken_at"][:len(since)] < since]
+        inside = [e for e in source_entries
+                  if e["taken_at"][:len(since)] >= since and e["taken_at"][:len(until)] <= until]
+        if not before and not inside:
+            continue
+
+        current, seen = set(), set()
+        if before:
+            _, columns = next(archive.iter_columns(before[-1:]))
+            current = set(columns["id"])
+            seen = set(current)
+        snapshots = archive.iter_columns(inside)
+        pending = next(snapshots, None)
+        for label in labels:
+            present, new, count = set(current), set(), 0
+            while pending is not None and pending[0]["taken_at"][:width] == label:
+                ids = set(pending[1]["id"])
+                present |= ids
+                new |= ids - seen
+                seen |= ids
+                current = ids
+                count += 1
+                pending = next(snapshots, None)
+            if count or present:
+                rows.append({"period": label, "source": key, "snapshots": count,
+                             "games": len(present), "new": len(new)})
+        snapshots.close()
+    rows.sort(key=lambda row: (row["period"], keys.index(row["source"])))
+    return rows
+
+
+# ──────────────────────────────────────────────
+# 소스 간 게임 동일성 인덱스
+# ──────────────────────────────────────────────
+
+_BRACKETS_RE = re.compile(r"\([^)]*\)|\[[^\]]*\]|<[^>]*>")
+_NON_WORD_RE = re.compile(r"[^0-9a-z가-힣ぁ-んァ-ン一-龥]+")
+_COMPANY_SUFFIX_RE = re.compile(r"\(주\)|㈜|주식회사|\b(?:inc|corp|corporation|co|ltd|llc|limited|games?|studios?)\b\.?")
+
 
+def normalize_title(title: str) -> str:
+    """비교용 제목: 전각/반각 통일, 소문자, 괄호 안 부가 설명과 공백/기호 제거."""
+    text = unicodedata.normalize("NFKC", title).lower()
+    stripped = _NON_WORD_RE.sub("", _BRACKETS_RE.sub(" ", text))
+    # 괄호만으로 된 제목이면 괄호 안 내용을 그대로 사용
+    return stripped or _NON_WORD_RE.sub("", text)
 
-def find_new(current: list[dict], saved: list[dict]) -> list[dict]:
-    saved_ids = {g["id"] for g in saved}
-    return [g for g in current if g["id"] not in saved_ids]
+
+def normalize_developer(developer: str) -> str:
+    """비교용 개발사명: 법인 표기(주식회사, Inc. 등)와 기호를 제거합니다."""
+    text = unicodedata.normalize("NFKC", developer or "").lower()
+    return _NON_WORD_RE.sub("", _COMPANY_SUFFIX_RE.sub(" ", text))
+
+
+_TITLE_TOKEN_RE = re.compile(r"[0-9a-z가-힣ぁ-んァ-ン一-龥]+")
+_ROMAN_NUMERAL_RE = re.compile(r"^(?:i{1,3}|iv|vi{0,3}|ix|x)$")
+
+
+def title_markers(title: str) -> tuple:
+    """제목에서 시리즈 / 버전을 가르는 표시(숫자, 한 글자 영문 토큰, 로마 숫자)를 순서대로 뽑습니다.
+
+    "아스달 연대기 2"와 "아스달 연대기 3", "프로젝트 A"와 "프로젝트 B"는 표시가 달라 다른 게임입니다.
+    """
+    text = unicodedata.normalize("NFKC", title).lower()
+    text = _BRACKETS_RE.sub(" ", text) if _TITLE_TOKEN_RE.search(_BRACKETS_RE.sub(" ", text)) else text
+    markers = []
+    for token in _TITLE_TOKEN_RE.findall(text):
+        if (len(token) == 1 and token.isascii() and token.isalpha()) or _ROMAN_NUMERAL_RE.match(token):
+            markers.append(token)
+        else:
+            markers.extend(re.findall(r"\d+", token))
+    return tuple(markers)
+
+
+def _bigrams(text: str) -> set[str]:
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class GameIndex:
+    """여러 소스의 레코드를 정규화 제목 + 개발사로 묶어 하나의 게임(canonical)으로 관리합니다.
+
+    후보는 제목 바이그램 역색인으로만 찾으므로 전체 레코드와 일일이 비교하지 않습니다.
+    제목의 숫자 / 한 글자 영문 표시(title_markers)가 다르면 유사도와 관계없이 다른 게임입니다.
+    """
+
+    def __init__(self, filepath: Path, threshold: float = GAME_MATCH_THRESHOLD):
+        self.filepath = filepath
+        self.threshold = threshold
+        self.games = {}
+        self._by_record = {}
+        self._postings = {}
+        self._grams = {}
+        self._markers = {}
+        self._lengths = {}
+        if filepath.exists():
+            try:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    self.games = json.load(f).get("games", {})
+            except (json.JSONDecodeError, IOError):
+                self.games = {}
+        for cid, entry in self.games.items():
+            self._add_to_index(cid, entry)
+
+    def _add_to_index(self, cid: str, entry: dict) -> None:
+        normalized = normalize_title(entry["title"])
+        grams = _bigrams(normalized)
+        self._grams[cid] = grams
+        self._markers[cid] = title_markers(entry["title"])
+        self._lengths[cid] = len(normalized)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(cid)
+        for source, link in entry["links"].items():
+            self._by_record[(source, link["id"])] = cid
+
+    def _developer_matches(self, cid: str, developer: str) -> bool:
+        # 한쪽이라도 개발사 정보가 없으면 제목만으로 판정
+        ours = normalize_developer(developer)
+        theirs = normalize_developer(self.games[cid].get("developer", ""))
+        if not ours or not theirs:
+            return True
+        return ours == theirs or ours in theirs or theirs in ours
+
+    def find(self, title: str, developer: str = "", source: str | None = None, record_id: str | None = None) -> str | None:
+        """가장 비슷한 기존 게임의 ID를 반환합니다. 기준 유사도에 못 미치면 None.
+
+        source를 주면 그 소스의 다른 레코드(record_id가 아닌 ID)에 이미 연결된 게임은 후보에서 뺍니다.
+        한 소스 안의 서로 다른 레코드는 서로 다른 게임입니다. (예: 속편)
+        """
+        normalized = normalize_title(title)
+        grams = _bigrams(normalized)
+        if not grams:
+            return None
+        markers = title_markers(title)
+        shared = {}
+        for gram in grams:
+            for cid in self._postings.get(gram, ()):
+                shared[cid] = shared.get(cid, 0) + 1
+
+        best, best_score = None, self.threshold
+        for cid, count in shared.items():
+            link = self.games[cid]["links"].get(source) if source else None
+            if link is not None and link["id"] != record_id:
+                continue
+            if self._markers[cid] != markers:
+                continue
+            score = 2 * count / (len(grams) + len(self._grams[cid]))
+            if min(len(normalized), self._lengths[cid]) < GAME_MATCH_SHORT_LENGTH:
+                if score < max(self.threshold, GAME_MATCH_SHORT_THRESHOLD):
+                    continue
+            if score >= best_score and self._developer_matches(cid, developer):
+                best, best_score = cid, score
+        return best
+
+    def resolve(self, source: str, game: dict) -> str:
+        """레코드가 속한 게임 ID를 반환합니다. 처음 보는 게임이면 새로 등록합니다."""
+        cid = self._by_record.get((source, game["id"]))
+        if cid is not None and self._markers[cid] != title_markers(game["title"]):
+            # 예전 기준으로 잘못 묶인 연결은 끊고 다시 찾음
+            entry = self.games[cid]
+            if entry["links"].get(source, {}).get("id") == game["id"]:
+                del entry["links"][source]
+            del self._by_record[(source, game["id"])]
+            cid = None
+        if cid is None:
+            cid = self.find(game["title"], game.get("developer", ""), source, game["id"])
+        if cid is None:
+            cid = f"G{len(self.games) + 1:06d}"
+            self.games[cid] = {"title": game["title"], "developer": game.get("developer", ""), "links": {}}
+
+        entry = self.games[cid]
+        if not entry.get("developer") and game.get("developer"):
+            entry["developer"] = game["developer"]
+        if entry["links"].get(source) != {"id": game["id"], "url": game["url"]}:
+            entry["links"][source] = {"id": game["id"], "url": game["url"]}
+            self._add_to_index(cid, entry)
+        return cid
+
+    def save(self) -> None:
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            json.dump({"games": self.games}, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def dedupe_new_games(index: GameIndex, new_by_source: dict) -> dict:
+    """여러 소스에 동시에 올라온 같은 게임은 처음 나온 소스에만 남기고, 다른 소스 링크를 "also"로 붙입니다.
+
+    같은 소스 안의 레코드끼리는 묶지 않습니다.
+    """
+    first_source = {}
+    deduped = {}
+    for source, games in new_by_source.items():
+        deduped[source] = []
+        for game in games:
+            cid = index.resolve(source, game)
+            if first_source.setdefault(cid, source) != source:
+                continue
+            also = [
+                {"source": other, "url": link["url"]}
+                for other, link in index.games[cid]["links"].items() if other != source
+            ]
+            deduped[source].append({**game, "also": also} if also else game)
+    return deduped
 
 
 # ──────────────────────────────────────────────
 # Slack 알림
 # ──────────────────────────────────────────────
 
-def _add_source_blocks(blocks: list, header: str, emoji: str, new: list):
+# 변경 알림에 표시할 필드 이름
+FIELD_LABELS = {
+    "title": "게임명",
+    "developer": "개발사",
+    "release_date": "출시일",
+    "reward": "보상",
+    "platform": "플랫폼",
+    "url": "링크",
+}
+
+
+def _add_source_blocks(blocks: list, header: str, emoji: str, new: list, modified: list = ()):
     """소스별 Slack 블록을 추가합니다."""
-    if not new:
+    if not new and not modified:
         return
 
     if blocks:  # 이전 섹션이 있으면 구분선
@@ -478,30 +2415,76 @@ def _add_source_blocks(blocks: list, header: str, emoji: str, new: list):
         "text": {"type": "plain_text", "text": f"{emoji} {header}", "emoji": True}
     })
 
-    blocks.append({"type": "divider"})
-    blocks.append({
-        "type": "section",
-        "text": {"type": "mrkdwn", "text": f"*🆕 신규 ({len(new)}개)*"}
-    })
+    if new:
+        blocks.append({"type": "divider"})
+        blocks.append({
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": f"*🆕 신규 ({len(new)}개)*"}
+        })
     for g in new:
         extra_parts = []
         if g.get("developer"):
             extra_parts.append(g["developer"])
         if g.get("release_date"):
             extra_parts.append(g["release_date"])
+        if g.get("also"):
+            # 다른 소스에도 있는 같은 게임 링크
+            also_links = ", ".join(f"<{a['url']}|{SOURCES[a['source']][0]}>" for a in g["also"])
+            extra_parts.append(f"🔗 {also_links}")
         extra = f" | {' | '.join(extra_parts)}" if extra_parts else ""
         blocks.append({
             "type": "section",
             "text": {"type": "mrkdwn", "text": f"• <{g['url']}|{g['title']}>{extra}"}
         })
 
+    if modified:
+        blocks.append({"type": "divider"})
+        blocks.append({
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": f"*🔄 변경 ({len(modified)}개)*"}
+        })
+    for m in modified:
+        g = m["game"]
+        lines = [
+            f"    {FIELD_LABELS.get(field, field)}: {before or '-'} → {after or '-'}"
+            for field, (before, after) in m["changes"].items()
+        ]
+        blocks.append({
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": f"• <{g['url']}|{g['title']}>\n" + "\n".join(lines)}
+        })
 
-def send_slack_notification(changes: dict) -> bool:
-    """Slack으로 알림을 보냅니다."""
-    if not SLACK_WEBHOOK_URL:
-        print("SLACK_WEBHOOK_URL이 설정되지 않았습니다.")
-        return False
 
+def _chunk_blocks(blocks: list, footer: list, limit: int = SLACK_MAX_BLOCKS) -> list[list]:
+    """블록을 메시지당 limit개 이하로 나눕니다.
+
+    나뉜 뒤 이어지는 메시지에는 소스 헤더를 "(계속)"으로 다시 붙이고, footer는 마지막 메시지에만 붙입니다.
+    """
+    messages = []
+    current = []
+    header = None
+    for block in blocks:
+        if len(current) >= limit:
+            messages.append(current)
+            current = []
+        if not current:
+            if block["type"] == "divider":
+                continue
+            if messages and header is not None and block["type"] != "header":
+                text = dict(header["text"], text=f"{header['text']['text']} (계속)")
+                current.append(dict(header, text=text))
+        if block["type"] == "header":
+            header = block
+        current.append(block)
+    if len(current) + len(footer) > limit:
+        messages.append(current)
+        current = []
+    messages.append(current + footer)
+    return messages
+
+
+def build_slack_messages(changes: dict) -> list[list]:
+    """변경사항을 Slack 메시지(블록 목록)들로 만듭니다. 메시지마다 블록 수 제한을 지킵니다."""
     blocks = []
 
     sources = [
@@ -514,63 +2497,455 @@ def send_slack_notification(changes: dict) -> bool:
 
     for header, emoji, key in sources:
         new = changes.get(f"{key}_new", [])
-        _add_source_blocks(blocks, header, emoji, new)
+        modified = changes.get(f"{key}_modified", [])
+        _add_source_blocks(blocks, header, emoji, new, modified)
 
-    blocks.append({"type": "divider"})
-    blocks.append({
-        "type": "section",
-        "text": {"type": "mrkdwn", "text": "📌 <https://newgamecalender.notion.site/pc-b672193ee56a48539e5bd54d57017a70|노션 신작 알림 달력> | <https://cafe.naver.com/f-e/cafes/24576196/menus/14|신작 게임 평가단 카페>"}
-    })
-    blocks.append({
-        "type": "context",
-        "elements": [{"type": "mrkdwn", "text": f"⏰ 확인 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} KST"}]
-    })
+    footer = [
+        {"type": "divider"},
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": "📌 <https://newgamecalender.notion.site/pc-b672193ee56a48539e5bd54d57017a70|노션 신작 알림 달력> | <https://cafe.naver.com/f-e/cafes/24576196/menus/14|신작 게임 평가단 카페>"}
+        },
+        {
+            "type": "context",
+            "elements": [{"type": "mrkdwn", "text": f"⏰ 확인 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} KST"}]
+        },
+    ]
+    return _chunk_blocks(blocks, footer)
+
+
+class SlackOutbox:
+    """보낼 Slack 메시지를 파일에 먼저 기록하고, 백그라운드 스레드가 순서대로 전송합니다.
+
+    전송에 성공한 메시지만 지우며, 실패하면 지수 백오프(Retry-After 우선)로 다시 시도합니다.
+    프로세스가 끝날 때까지 보내지 못한 메시지는 파일에 남아 다음 실행에서 이어서 보냅니다.
+    """
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self._messages = None
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def _load(self) -> list:
+        if self._messages is None:
+            self._messages = []
+            if self.filepath.exists():
+                try:
+                    with open(self.filepath, "r", encoding="utf-8") as f:
+                        self._messages = json.load(f).get("messages", [])
+                except (json.JSONDecodeError, IOError):
+                    pass
+        return self._messages
+
+    def _save(self) -> None:
+        tmp = self.filepath.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"messages": self._load()}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.filepath)
+
+    def save(self) -> None:
+        with self._cond:
+            self._save()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._load())
+
+    def add(self, messages: list[list]) -> None:
+        """메시지들을 파일에 기록한 뒤 전송 스레드를 깨웁니다."""
+        with self._cond:
+            queued = self._load()
+            stamp = datetime.now().isoformat()
+            for i, blocks in enumerate(messages):
+                queued.append({"id": f"{stamp}#{i}", "blocks": blocks, "attempts": 0, "next_at": 0})
+            self._save()
+            self._cond.notify_all()
+        self.start()
+
+    def start(self) -> None:
+        """전송 스레드를 시작합니다. 이전 실행에서 남은 메시지도 함께 보냅니다."""
+        with self._cond:
+            if self._thread is None and SLACK_WEBHOOK_URL:
+                self._thread = threading.Thread(target=self._run, name="slack", daemon=True)
+                self._thread.start()
+
+    def drain(self, timeout: float) -> int:
+        """남은 메시지가 모두 전송되거나 timeout초가 지날 때까지 기다리고, 남은 메시지 수를 반환합니다."""
+        end = time.monotonic() + timeout
+        with self._cond:
+            while self._load() and self._thread is not None:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return len(self._load())
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                # 메시지가 나뉘어 있을 수 있으므로 항상 맨 앞 메시지부터 보냄
+                while not self._load() or self._load()[0]["next_at"] > time.time():
+                    wait = self._load()[0]["next_at"] - time.time() if self._load() else None
+                    self._cond.wait(wait)
+                entry = self._load()[0]
+            self._deliver(entry)
+
+    def _deliver(self, entry: dict) -> None:
+        retry_after = None
+        rejected = False
+        try:
+            response = http_session().post(SLACK_WEBHOOK_URL, json={"blocks": entry["blocks"]}, timeout=10)
+        except req.RequestException as e:
+            error = str(e)
+        else:
+            if response.ok:
+                with self._cond:
+                    self._load().remove(entry)
+                    self._save()
+                    self._cond.notify_all()
+                print("Slack 알림 전송 성공")
+                return
+            error = f"HTTP {response.status_code} {response.text[:200]}".strip()
+            retry_after = _retry_after(response)
+            rejected = 400 <= response.status_code < 500 and response.status_code != 429
+
+        with self._cond:
+            entry["attempts"] += 1
+            if rejected and entry["attempts"] >= SLACK_MAX_REJECTS:
+                # 요청 자체가 거부되는 메시지는 계속 재시도해도 성공하지 않으므로 폐기
+                self._load().remove(entry)
+                print(f"Slack 알림 전송 실패 ({error}), {entry['attempts']}회 거부되어 폐기")
+            else:
+                delay = _backoff_delay(entry["attempts"], retry_after)
+                entry["next_at"] = time.time() + delay
+                print(f"Slack 알림 전송 실패 ({error}), {delay:.1f}초 후 재시도")
+            self._save()
+            self._cond.notify_all()
 
-    try:
-        response = req.post(SLACK_WEBHOOK_URL, json={"blocks": blocks}, timeout=10)
-        response.raise_for_status()
-        print("Slack 알림 전송 성공")
-        return True
-    except req.RequestException as e:
-        print(f"Slack 알림 전송 실패: {e}")
+
+slack_outbox = SlackOutbox(SLACK_OUTBOX_FILE)
+
+
+def send_slack_notification(changes: dict) -> bool:
+    """Slack 알림을 전송 대기열(slack_outbox.json)에 넣습니다. 전송은 백그라운드에서 진행됩니다."""
+    if not SLACK_WEBHOOK_URL:
+        print("SLACK_WEBHOOK_URL이 설정되지 않았습니다.")
         return False
 
+    messages = build_slack_messages(changes)
+    slack_outbox.add(messages)
+    print(f"Slack 알림 {len(messages)}건 전송 대기열에 추가")
+    return True
+
+
+# ──────────────────────────────────────────────
+# 샤드 실행 / 병합
+# ──────────────────────────────────────────────
+
+def fetch_only(name: str, fetch_fn, filepath: Path, source: str | None = None) -> dict:
+    """비교 없이 현재 목록만 가져옵니다. 목록이 이전과 같으면 current는 None, unchanged는 True입니다."""
+    try:
+        current = list(fetch_fn())
+    except ListingUnchanged:
+        print(f"[{name}] 목록 변경 없음")
+        return {"current": None, "unchanged": True}
+    print(f"[{name}] 현재: {len(current)}개")
+    if source:
+        metrics.set_items(source, current=len(current))
+    return {"current": current, "unchanged": False}
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, default=_json_default)
+    os.replace(tmp, path)
+
+
+def run_shard(keys: list[str], shard_dir: Path, run_id: str, shard_name: str, concurrent: bool = True) -> Path:
+    """keys 소스만 수집해 샤드 결과 파일을 씁니다. 비교, 알림, 상태 저장은 merge에서 한 번에 합니다."""
+    started_at = datetime.now().isoformat()
+    started = time.time()
+    results = run_sources(keys, concurrent=concurrent, check=fetch_only)
+
+    partial = {
+        "run_id": run_id,
+        "shard": shard_name,
+        "started_at": started_at,
+        "finished_at": datetime.now().isoformat(),
+        "sources": {},
+        "enrich": enrich_cache.export(started),
+    }
+    for key in keys:
+        stats = metrics.export(key) or {"status": "failed"}
+        partial["sources"][key] = {
+            "status": stats["status"],
+            "current": results[key]["current"],
+            "listing": listing_state.staged(key),
+            "metrics": stats,
+        }
+    path = shard_dir / run_id / f"{shard_name}.json"
+    _write_json_atomic(path, partial)
+    return path
+
+
+def load_partials(shard_dir: Path, run_id: str, keys: list[str], wait: float = 0) -> tuple[dict, list[dict]]:
+    """run_id의 샤드 결과 파일에서 소스별 결과와 상세 조회 캐시 항목들을 모읍니다.
+
+    keys 중 결과가 없는 소스가 있으면 wait초까지 기다립니다. 같은 소스의 결과가 여럿이면
+    (재실행된 샤드 등) 성공한 결과 중 가장 최근 것을 씁니다.
+    """
+    run_dir = shard_dir / run_id
+    deadline = time.monotonic() + wait
+    while True:
+        found = {}
+        enrich = []
+        for path in sorted(run_dir.glob("*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    partial = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                continue
+            if partial.get("run_id") != run_id:
+                continue
+            enrich.append(partial.get("enrich", {}))
+            for key, entry in partial.get("sources", {}).items():
+                if key not in keys:
+                    continue
+                entry = dict(entry, shard=partial.get("shard", path.stem), started_at=partial["started_at"])
+                rank = (entry["status"] in ("ok", "unchanged"), entry["started_at"])
+                best = found.get(key)
+                if best is None or rank > (best["status"] in ("ok", "unchanged"), best["started_at"]):
+                    found[key] = entry
+
+        missing = [key for key in keys if key not in found]
+        remaining = deadline - time.monotonic()
+        if not missing or remaining <= 0:
+            return found, enrich
+        print(f"[병합] 샤드 결과 대기 중: {', '.join(missing)} ({remaining:.0f}초 남음)")
+        time.sleep(min(5.0, remaining))
+
+
+def _partial_fetcher(entry: dict):
+    def fetch():
+        if entry["status"] == "unchanged":
+            raise ListingUnchanged()
+        return [GameRecord(g) for g in entry["current"]]
+    return fetch
+
+
+def merge_shards(keys: list[str], shard_dir: Path, run_id: str, wait: float = 0) -> dict:
+    """샤드 결과를 저장된 상태와 비교해 run_sources와 같은 형태의 결과를 만듭니다.
+
+    결과가 없거나 실패한 소스, 저장된 상태보다 먼저 시작된(늦게 도착한 이전) 결과는 건너뛰어 이전 상태를 유지합니다.
+    """
+    found, enrich = load_partials(shard_dir, run_id, keys, wait)
+    for entries in enrich:
+        enrich_cache.merge(entries)
+
+    sources = {}
+    for key in keys:
+        name, _, filepath = SOURCES[key]
+        entry = found.get(key)
+        sources[key] = _failed_result()
+        if entry is None:
+            print(f"[{name}] 샤드 결과 없음, 이전 상태 유지")
+            metrics.finish(key, "missing", 0.0)
+            continue
+        if entry.get("metrics"):
+            metrics.load(key, entry["metrics"])
+        if entry["status"] not in ("ok", "unchanged"):
+            print(f"[{name}] 샤드 {entry['shard']} 결과가 {entry['status']}, 이전 상태 유지")
+            continue
+        if entry["started_at"] < load_snapshot(filepath).get("updated_at", ""):
+            print(f"[{name}] 샤드 {entry['shard']} 결과가 저장된 상태보다 오래됨, 건너뜀")
+            metrics.finish(key, "stale", 0.0)
+            continue
+        if entry.get("listing"):
+            listing_state.stage(key, entry["listing"])
+        sources[key] = check_source(name, _partial_fetcher(entry), filepath, source=key)
+    return sources
+
 
 # ──────────────────────────────────────────────
 # 메인
 # ──────────────────────────────────────────────
 
-def check_source(name: str, fetch_fn, filepath: Path) -> dict:
-    """소스별 크롤링 및 비교를 수행합니다."""
-    current = fetch_fn()
+# 소스 목록: 키 → (표시 이름, 크롤링 함수, 저장 파일)
+SOURCES = {
+    "gplay": ("Google Play", fetch_gplay_games, GAMES_FILE),
+    "inven": ("인벤", fetch_inven_games, INVEN_GAMES_FILE),
+    "kakao": ("카카오게임즈", fetch_kakao_games, KAKAO_GAMES_FILE),
+    "onestore": ("원스토어", fetch_onestore_games, ONESTORE_GAMES_FILE),
+    "naver": ("네이버게임", fetch_naver_games, NAVER_GAMES_FILE),
+}
+
+
+def use_state_dir(state_dir: Path) -> None:
+    """상태 파일을 state_dir 아래에서 읽고 쓰도록 바꿉니다."""
+    global STATE_DIR, ENRICH_CACHE_FILE, LISTING_STATE_FILE, GAME_INDEX_FILE, RUN_REPORT_FILE, SLACK_OUTBOX_FILE
+    global ARCHIVE_DIR, enrich_cache, listing_state, slack_outbox, snapshot_archive
+    state_dir.mkdir(parents=True, exist_ok=True)
+    STATE_DIR = state_dir
+    for key, (name, fetch_fn, filepath) in SOURCES.items():
+        SOURCES[key] = (name, fetch_fn, state_dir / filepath.name)
+    ENRICH_CACHE_FILE = state_dir / ENRICH_CACHE_FILE.name
+    LISTING_STATE_FILE = state_dir / LISTING_STATE_FILE.name
+    GAME_INDEX_FILE = state_dir / GAME_INDEX_FILE.name
+    RUN_REPORT_FILE = state_dir / RUN_REPORT_FILE.name
+    SLACK_OUTBOX_FILE = state_dir / SLACK_OUTBOX_FILE.name
+    ARCHIVE_DIR = state_dir / ARCHIVE_DIR.name
+    enrich_cache = EnrichCache(ENRICH_CACHE_FILE, ENRICH_CACHE_TTL, ENRICH_CACHE_MAX_ENTRIES)
+    listing_state = ListingState(LISTING_STATE_FILE)
+    slack_outbox = SlackOutbox(SLACK_OUTBOX_FILE)
+    snapshot_archive = SnapshotArchive(ARCHIVE_DIR)
+
+
+def _parse_sources(value: str) -> list[str]:
+    """"inven,naver" 형식의 소스 목록을 SOURCES 순서로 정리합니다."""
+    keys = {key.strip() for key in value.split(",") if key.strip()}
+    unknown = keys - set(SOURCES)
+    if unknown or not keys:
+        raise argparse.ArgumentTypeError(
+            f"알 수 없는 소스: {', '.join(sorted(unknown)) or value} (선택 가능: {', '.join(SOURCES)})")
+    return [key for key in SOURCES if key in keys]
+
+
+def check_source(name: str, fetch_fn, filepath: Path, source: str | None = None) -> dict:
+    """소스별 크롤링 및 비교를 수행합니다. state_store가 있으면 source 키로 DB에서 신규를 판정합니다."""
     saved = load_saved(filepath)
-    new = find_new(current, saved)
+    if state_store is not None and source and state_store.count(source) == 0:
+        # DB를 처음 쓰는 소스는 기존 JSON 상태를 가져와 시작
+        state_store.upsert(source, saved)
+    unchanged = False
+    try:
+        # fetch_fn이 제너레이터면 받아오는 대로 비교
+        diff = diff_games(fetch_fn(), saved)
+    except ListingUnchanged:
+        print(f"[{name}] 목록 변경 없음, 저장된 상태 사용")
+        diff = diff_games(saved, saved)
+        unchanged = True
+    current = diff["current"]
+    if state_store is not None and source:
+        new = state_store.find_new(source, current)
+    else:
+        new = diff["added"]
+
+    print(
+        f"[{name}] 현재: {len(current)}개 | 신규: {len(new)}개"
+        f" | 변경: {len(diff['modified'])}개 | 삭제: {len(diff['removed'])}개"
+    )
+    if source:
+        metrics.set_items(
+            source, current=len(current), new=len(new), modified=len(diff["modified"]), removed=len(diff["removed"])
+        )
 
-    print(f"[{name}] 현재: {len(current)}개 | 신규: {len(new)}개")
+    return {
+        "current": current,
+        "new": new,
+        "modified": diff["modified"],
+        "removed": diff["removed"],
+        "unchanged": unchanged,
+    }
 
-    return {"current": current, "new": new}
 
+def _run_source(key: str, results: dict, profile_dir: Path | None = None, check=None) -> None:
+    """시간 제한을 걸고 소스 하나를 실행해 results[key]에 결과를 기록합니다.
 
-def main():
-    print(f"{'='*50}")
-    print(f"[{datetime.now().isoformat()}] 사전등록 게임 확인 시작")
-    print(f"{'='*50}\n")
+    check는 check_source와 같은 형태의 함수이며 기본값은 check_source입니다.
+    profile_dir가 있으면 소스별 cProfile / tracemalloc 덤프를 남깁니다. (이 스레드만 프로파일링)
+    """
+    check = check or check_source
+    name, fetch_fn, filepath = SOURCES[key]
+    timeout = SOURCE_TIMEOUTS.get(key, 300)
+    if not filepath.exists():
+        # 저장된 상태가 없으면 변경 없음으로 건너뛸 수 없으므로 이전 응답 정보를 버림
+        listing_state.forget(key)
+    _source_ctx.deadline = time.monotonic() + timeout
+    _source_ctx.key = key
+    started = time.perf_counter()
+    status = "failed"
+
+    profiler = cProfile.Profile() if profile_dir else None
+    if profiler:
+        tracemalloc.start()
+        profiler.enable()
+    try:
+        # 동시에 실행되는 다른 소스와 로그가 섞이지 않도록 소스가 끝날 때 한 번에 출력
+        with source_output(key):
+            try:
+                results[key] = check(name, fetch_fn, filepath, source=key)
+                status = "unchanged" if results[key]["unchanged"] else "ok"
+            except SourceTimeout:
+                status = "timeout"
+                print(f"[{name}] 시간 제한({timeout}초) 초과로 중단")
+            except Exception as e:
+                print(f"[{name}] 크롤링 실패: {e}")
+    finally:
+        metrics.finish(key, status, time.perf_counter() - started)
+        _source_ctx.deadline = None
+        _source_ctx.key = None
+        if profiler:
+            profiler.disable()
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(profile_dir / f"{key}.prof"))
+            tracemalloc.take_snapshot().dump(str(profile_dir / f"{key}.tracemalloc"))
+            tracemalloc.stop()
+
+
+def run_sources(keys: list[str], concurrent: bool = True, profile_dir: Path | None = None, check=None) -> dict:
+    """소스들을 실행합니다. 시간 안에 끝나지 않거나 실패한 소스는 current가 None입니다.
+
+    프로파일링은 소스별로 구분되도록 순서대로 실행할 때만 지원합니다.
+    """
+    results = {}
+
+    if concurrent:
+        # 데몬 스레드로 실행해 멈춘 소스가 프로세스 종료를 막지 않도록 함
+        started = time.monotonic()
+        threads = {}
+        for key in keys:
+            t = threading.Thread(target=_run_source, args=(key, results, None, check), name=key, daemon=True)
+            t.start()
+            threads[key] = t
+        for key, t in threads.items():
+            # 협조적 중단이 닿지 않는 블로킹 호출을 위해 여유 시간을 둠
+            remaining = started + SOURCE_TIMEOUTS.get(key, 300) + SOURCE_HUNG_GRACE - time.monotonic()
+            t.join(max(remaining, 0))
+            if t.is_alive():
+                metrics.finish(key, "hung", time.monotonic() - started)
+                release_source_output(key)
+                print(f"[{SOURCES[key][0]}] 응답 없음, 결과를 기다리지 않고 진행")
+    else:
+        for key in keys:
+            _run_source(key, results, profile_dir, check)
 
-    # 각 소스 크롤링
-    sources = {
-        "gplay": check_source("Google Play", fetch_gplay_games, GAMES_FILE),
-        "inven": check_source("인벤", fetch_inven_games, INVEN_GAMES_FILE),
-        "kakao": check_source("카카오게임즈", fetch_kakao_games, KAKAO_GAMES_FILE),
-        "onestore": check_source("원스토어", fetch_onestore_games, ONESTORE_GAMES_FILE),
-        "naver": check_source("네이버게임", fetch_naver_games, NAVER_GAMES_FILE),
-    }
+    # 스레드가 아직 결과를 쓰는 중일 수 있으므로 복사본으로 정리
+    snapshot = dict(results)
+    return {key: snapshot.get(key) or _failed_result() for key in keys}
+
+
+def _failed_result() -> dict:
+    return {"current": None, "new": [], "modified": [], "removed": [], "unchanged": False}
+
+
+def publish_results(sources: dict, game_index: GameIndex) -> None:
+    """실행 결과를 알리고 저장합니다. 실패하거나 시간 초과된 소스는 이전 상태를 유지합니다."""
+    # 소스 간 같은 게임을 하나로 묶어 알림 중복 제거
+    for key, result in sources.items():
+        for g in result["current"] or []:
+            game_index.resolve(key, g)
+    deduped_new = dedupe_new_games(game_index, {key: result["new"] for key, result in sources.items()})
 
     # 변경사항 확인
     changes = {}
     has_changes = False
     for key, result in sources.items():
-        changes[f"{key}_new"] = result["new"]
-        if result["new"]:
+        changes[f"{key}_new"] = deduped_new[key]
+        changes[f"{key}_modified"] = result["modified"]
+        if result["new"] or result["modified"]:
             has_changes = True
 
     if has_changes:
@@ -584,17 +2959,306 @@ def main():
                 for g in result["new"]:
                     extra = f" ({g.get('developer', '')})" if g.get("developer") else ""
                     print(f"  • {g['title']}{extra}")
+            if result["modified"]:
+                print(f"\n[{key} 변경]")
+                for m in result["modified"]:
+                    fields = ", ".join(m["changes"])
+                    print(f"  • {m['game']['title']} ({fields})")
 
         send_slack_notification(changes)
     else:
         print("\n변경사항이 없습니다.")
 
-    # 저장
-    save_games(GAMES_FILE, sources["gplay"]["current"])
-    save_games(INVEN_GAMES_FILE, sources["inven"]["current"])
-    save_games(KAKAO_GAMES_FILE, sources["kakao"]["current"])
-    save_games(ONESTORE_GAMES_FILE, sources["onestore"]["current"])
-    save_games(NAVER_GAMES_FILE, sources["naver"]["current"])
+    for key, result in sources.items():
+        if result["removed"]:
+            print(f"\n[{key} 삭제]")
+            for g in result["removed"]:
+                print(f"  • {g['title']}")
+
+    # 저장 (실패하거나 시간 초과된 소스는 이전 상태 유지)
+    for key, result in sources.items():
+        if result["current"] is not None:
+            if state_store is not None:
+                state_store.upsert(key, result["current"])
+            changed = save_games(SOURCES[key][2], result["current"])
+            if not changed:
+                print(f"[{SOURCES[key][0]}] 변경 없음, 저장 생략")
+            # 보관소에는 목록이 바뀐 스냅샷만 쌓음 (조회 시 다음 스냅샷 전까지 유효)
+            if changed or snapshot_archive.latest(key) is None:
+                snapshot_archive.append(key, result["current"])
+            listing_state.commit(key)
+    enrich_cache.save()
+    listing_state.save()
+    game_index.save()
+
+
+def watch(keys: list[str], intervals: dict, browser_max_uses: int, on_results) -> None:
+    """소스마다 정해진 간격으로 반복 실행하고, 끝난 소스의 결과를 바로 on_results로 넘깁니다.
+
+    Google Play는 Chromium을 계속 띄워 두는 전용 스레드에서, 나머지는 실행마다 새 스레드에서 실행합니다.
+    이미 실행 중인 소스는 끝날 때까지 다시 시작하지 않습니다. 시간 제한 + SOURCE_HUNG_GRACE가 지나도
+    끝나지 않은 실행은 실패로 알리고 포기하며(늦게 온 결과는 버림), Google Play면 브라우저 스레드를 새로 띄웁니다.
+    Ctrl+C 또는 SIGTERM으로 종료합니다.
+    """
+    done = queue.Queue()
+    stop = threading.Event()
+    running = {}  # 키 → (실행 번호, 시작 시각)
+    runs = itertools.count(1)
+    next_run = {key: time.monotonic() for key in keys}
+
+    def run(key: str, run_no: int) -> None:
+        results = {}
+        metrics.reset(key)
+        try:
+            _run_source(key, results)
+        finally:
+            done.put((key, run_no, results.get(key)))
+
+    def browser_worker(jobs: queue.Queue) -> None:
+        _browser_local.warm = WarmBrowser(browser_max_uses)
+        try:
+            while (job := jobs.get()) is not None:
+                run(*job)
+        finally:
+            _browser_local.warm.close()
+            _browser_local.warm = None
+
+    def start_browser() -> tuple[threading.Thread, queue.Queue]:
+        jobs = queue.Queue()
+        thread = threading.Thread(target=browser_worker, args=(jobs,), name="browser", daemon=True)
+        thread.start()
+        return thread, jobs
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    browser_thread, browser_jobs = start_browser()
+
+    try:
+        while not stop.is_set():
+            now = time.monotonic()
+            for key, (run_no, started) in list(running.items()):
+                if now - started < SOURCE_TIMEOUTS.get(key, 300) + SOURCE_HUNG_GRACE:
+                    continue
+                del running[key]
+                metrics.finish(key, "hung", now - started)
+                release_source_output(key)
+                print(f"[{SOURCES[key][0]}] 응답 없음, 이번 실행을 포기하고 다음 간격에 다시 실행")
+                if key == "gplay":
+                    # 멈춘 브라우저 스레드는 풀려나면 종료하도록 하고 새 스레드로 교체
+                    browser_jobs.put(None)
+                    browser_thread, browser_jobs = start_browser()
+                on_results({key: _failed_result()})
+
+            for key in keys:
+                if key in running or now < next_run[key]:
+                    continue
+                run_no = next(runs)
+                running[key] = (run_no, now)
+                next_run[key] = now + intervals[key]
+                if key == "gplay":
+                    browser_jobs.put((key, run_no))
+                else:
+                    threading.Thread(target=run, args=(key, run_no), name=key, daemon=True).start()
+
+            idle = [next_run[key] for key in keys if key not in running]
+            wait = min(idle, default=now + 1) - now
+            try:
+                key, run_no, result = done.get(timeout=min(max(wait, 0), 1.0))
+            except queue.Empty:
+                continue
+            if running.get(key, (None,))[0] != run_no:
+                # 이미 포기한 실행의 늦은 결과
+                continue
+            del running[key]
+            on_results({key: result or _failed_result()})
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print("\n[감시] 종료 중...")
+        browser_jobs.put(None)
+        browser_thread.join(timeout=30)
+
+
+def _parse_intervals(values: list[str]) -> dict:
+    """"kakao=300" 형식의 간격 설정을 기본 간격 위에 덮어씁니다."""
+    intervals = dict(WATCH_INTERVALS)
+    for value in values:
+        key, sep, seconds = value.partition("=")
+        if not sep or key not in SOURCES:
+            raise argparse.ArgumentTypeError(f"잘못된 간격 설정: {value} (예: kakao=300)")
+        try:
+            intervals[key] = float(seconds)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"잘못된 간격 설정: {value} (예: kakao=300)") from None
+        if intervals[key] <= 0:
+            raise argparse.ArgumentTypeError(f"간격은 0보다 커야 합니다: {value}")
+    return intervals
+
+
+def _parse_period(value: str) -> str:
+    """YYYY-MM 또는 YYYY-MM-DD 형식을 확인합니다."""
+    for fmt in ("%Y-%m", "%Y-%m-%d"):
+        try:
+            datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        if len(value) in (7, 10):
+            return value
+    raise argparse.ArgumentTypeError(f"잘못된 기간: {value} (예: 2026-01 또는 2026-01-15)")
+
+
+def print_history(store: StateStore, keys: list[str]) -> None:
+    """소스별로 게임마다 처음 / 마지막 발견 날짜와 현재 목록에 있는지를 출력합니다."""
+    for key in keys:
+        rows = store.history(key)
+        print(f"[{SOURCES[key][0]}] {len(rows)}개 (현재 목록 {sum(row['present'] for row in rows)}개)")
+        if rows:
+            print(f"  {'처음 발견':<10} {'마지막 발견':<10} {'상태':<4} 게임")
+        for row in rows:
+            status = "목록" if row["present"] else "빠짐"
+            print(f"  {row['first_seen'][:10]:<14} {row['last_seen'][:10]:<15} {status:<4} {row.get('title', row['id'])}")
+        print()
+
+
+def finish_slack_delivery() -> None:
+    """대기 중인 Slack 알림을 잠시 기다리고, 남은 알림은 다음 실행을 위해 파일에 남깁니다."""
+    remaining = slack_outbox.drain(SLACK_DRAIN_TIMEOUT)
+    slack_outbox.save()
+    if remaining:
+        print(f"Slack 알림 {remaining}건 미전송, 다음 실행에서 다시 시도")
+
+
+def write_metrics(args) -> None:
+    """실행 보고서와 (지정된 경우) Prometheus 지표 파일을 씁니다."""
+    metrics.write_report(Path(args.report) if args.report else RUN_REPORT_FILE)
+    if args.prom_file:
+        metrics.write_prometheus(Path(args.prom_file))
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="사전등록 게임 모니터링")
+    parser.add_argument("command", nargs="?", choices=["run", "watch", "shard", "merge", "archive", "history"], default="run",
+                        help="run: 한 번 실행 (기본) / watch: 소스별 간격으로 계속 실행 / "
+                             "shard: --sources만 수집해 샤드 결과 파일 저장 / merge: 샤드 결과를 합쳐 비교, 알림, 저장 / "
+                             "archive: 스냅샷 보관소에서 기간별 게임 수 조회 / "
+                             "history: --db 상태 저장소에서 게임별 처음/마지막 발견 시각 조회")
+    parser.add_argument("--sources", type=_parse_sources, default=list(SOURCES), metavar="KEY[,KEY...]",
+                        help=f"실행할 소스 (기본: 전체 - {','.join(SOURCES)})")
+    parser.add_argument("--state-dir", help="상태 파일(목록 JSON, 캐시, 인덱스, 보고서)을 둘 디렉터리 (기본: STATE_DIR 환경변수 또는 main.py 위치)")
+    parser.add_argument("--serial", action="store_true", help="소스를 동시에 실행하지 않고 하나씩 실행")
+    parser.add_argument("--db", default=STATE_DB, help="SQLite 상태 저장소 경로 (기본: STATE_DB 환경변수, 없으면 JSON만 사용)")
+    parser.add_argument("--report", help="실행 보고서(JSON) 경로 (기본: 상태 디렉터리의 run_report.json)")
+    parser.add_argument("--prom-file", help="Prometheus textfile collector 형식 지표 파일 경로")
+    parser.add_argument("--profile", nargs="?", const="profiles", metavar="DIR",
+                        help="소스별 cProfile / tracemalloc 덤프 저장 (소스를 순서대로 실행, 기본 DIR: profiles)")
+    parser.add_argument("--gplay-mode", choices=["auto", "http", "browser"], help="Google Play 수집 방식 (기본: GPLAY_MODE 환경변수 또는 auto)")
+    parser.add_argument("--interval", action="append", default=[], metavar="SOURCE=SECONDS",
+                        help="watch 모드의 소스별 실행 간격 (여러 번 지정 가능, 기본: main.py의 WATCH_INTERVALS)")
+    parser.add_argument("--browser-max-uses", type=int, default=WATCH_BROWSER_MAX_USES, metavar="N",
+                        help="watch 모드에서 Chromium을 N번 실행에 재사용한 뒤 새로 띄움 (기본: WATCH_BROWSER_MAX_USES 환경변수 또는 12)")
+    parser.add_argument("--run-id", default=RUN_ID, help="shard / merge 실행 ID (기본: RUN_ID 또는 GITHUB_RUN_ID 환경변수, 없으면 오늘 날짜)")
+    parser.add_argument("--shard-dir", help="샤드 결과 파일 디렉터리 (기본: 상태 디렉터리의 shards/)")
+    parser.add_argument("--shard-name", help="shard 결과 파일 이름 (기본: 소스 목록)")
+    parser.add_argument("--wait", type=float, default=0, metavar="SECONDS",
+                        help="merge 시 결과가 없는 소스의 샤드를 기다릴 최대 시간 (기본: 0)")
+    parser.add_argument("--since", type=_parse_period, metavar="YYYY-MM[-DD]", help="archive 조회 시작 기간 (기본: 첫 스냅샷)")
+    parser.add_argument("--until", type=_parse_period, metavar="YYYY-MM[-DD]", help="archive 조회 마지막 기간, 포함 (기본: 오늘)")
+    parser.add_argument("--by", choices=["day", "month"], default="month", help="archive 조회 집계 단위 (기본: month)")
+    parser.add_argument("--naver-months", type=int, metavar="N", help="네이버게임 출시 목록을 이번 달 외에 다음 N개월까지 조회 (기본: NAVER_MONTHS_AHEAD 환경변수 또는 0)")
+    args = parser.parse_args(argv)
+    if not isinstance(sys.stdout, SourceOutput):
+        sys.stdout = SourceOutput(sys.stdout)
+
+    global GPLAY_MODE, NAVER_MONTHS_AHEAD, state_store
+    if args.gplay_mode:
+        GPLAY_MODE = args.gplay_mode
+    if args.naver_months is not None:
+        NAVER_MONTHS_AHEAD = max(0, args.naver_months)
+    if args.state_dir:
+        use_state_dir(Path(args.state_dir))
+
+    if args.command == "archive":
+        rows = query_archive(snapshot_archive, args.sources, args.since, args.until, args.by)
+        if not rows:
+            print("보관된 스냅샷이 없습니다.")
+            return 0
+        print(f"{'기간':<10} {'소스':<10} {'스냅샷':>6} {'게임':>6} {'신규':>6}")
+        for row in rows:
+            print(f"{row['period']:<12} {row['source']:<12} {row['snapshots']:>9} {row['games']:>8} {row['new']:>8}")
+        return 0
+
+    if args.command == "history":
+        if not args.db:
+            parser.error("history 명령에는 --db (또는 STATE_DB 환경변수)가 필요합니다")
+        store = StateStore(Path(args.db))
+        try:
+            print_history(store, args.sources)
+        finally:
+            store.close()
+        return 0
+
+    if args.command != "shard":
+        # 이전 실행에서 보내지 못한 알림은 크롤링과 동시에 전송 (샤드는 알림을 보내지 않음)
+        slack_outbox.start()
+    if args.db:
+        state_store = StateStore(Path(args.db))
+
+    run_id = args.run_id or datetime.now().strftime("%Y%m%d")
+    shard_dir = Path(args.shard_dir) if args.shard_dir else STATE_DIR / SHARD_DIR.name
+
+    if args.command == "shard":
+        shard_name = args.shard_name or "-".join(args.sources)
+        path = run_shard(args.sources, shard_dir, run_id, shard_name, concurrent=not args.serial)
+        enrich_cache.save()
+        write_metrics(args)
+        print(f"[샤드] {shard_name} 결과 저장: {path}")
+        return 0
+
+    if args.command == "merge":
+        print(f"[병합] 실행 ID {run_id}의 샤드 결과 병합")
+        sources = merge_shards(args.sources, shard_dir, run_id, wait=args.wait)
+        game_index = GameIndex(GAME_INDEX_FILE)
+        publish_results(sources, game_index)
+        if state_store is not None:
+            state_store.close()
+        write_metrics(args)
+        finish_slack_delivery()
+        return 0
+
+    if args.command == "watch":
+        try:
+            intervals = _parse_intervals(args.interval)
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+        game_index = GameIndex(GAME_INDEX_FILE)
+
+        def on_results(sources: dict) -> None:
+            publish_results(sources, game_index)
+            write_metrics(args)
+
+        print(f"[{datetime.now().isoformat()}] 감시 시작: "
+              + ", ".join(f"{key} {intervals[key]:.0f}초" for key in args.sources))
+        watch(args.sources, intervals, max(1, args.browser_max_uses), on_results)
+        finish_slack_delivery()
+        if state_store is not None:
+            state_store.close()
+        return 0
+
+    print(f"{'='*50}")
+    print(f"[{datetime.now().isoformat()}] 사전등록 게임 확인 시작")
+    print(f"{'='*50}\n")
+
+    # 각 소스 크롤링
+    profile_dir = Path(args.profile) if args.profile else None
+    sources = run_sources(args.sources, concurrent=not (args.serial or profile_dir), profile_dir=profile_dir)
+
+    game_index = GameIndex(GAME_INDEX_FILE)
+    publish_results(sources, game_index)
+    if state_store is not None:
+        state_store.close()
+
+    write_metrics(args)
+    finish_slack_delivery()
 
     print(f"\n{'='*50}")
     print("완료")
@@ -0,0 +1,505 @@
+"""main.py 회귀 테스트 (python -m pytest tests)"""
+
+import io
+import itertools
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+@pytest.fixture
+def http_server():
+    """항상 같은 상태 코드로 답하는 로컬 서버. 받은 요청 수는 server.hits에 쌓입니다."""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.server.hits += 1
+            self.send_response(self.server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.hits = 0
+    server.status = 503
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fast_http(monkeypatch):
+    monkeypatch.setattr(main, "HTTP_BACKOFF_BASE", 0.001)
+    monkeypatch.setattr(main, "CIRCUIT_FAILURE_THRESHOLD", 2)
+    monkeypatch.setattr(main, "CIRCUIT_RESET_SECONDS", 0.05)
+    monkeypatch.setattr(main, "_host_breakers", {})
+
+
+@pytest.fixture
+def state_dir(tmp_path):
+    original = main.STATE_DIR
+    main.use_state_dir(tmp_path)
+    yield tmp_path
+    main.use_state_dir(original)
+
+
+def test_half_open_probe_failure_reopens_and_probes_again(http_server, fast_http):
+    url = f"http://127.0.0.1:{http_server.server_address[1]}/"
+    for _ in range(2):
+        assert main.http_get(url).status_code == 503
+    with pytest.raises(main.CircuitOpen):
+        main.http_get(url)
+
+    # 시험 요청은 재시도하지 않고 한 번만 보냄, 실패하면 다시 열린 뒤 다음 시험 요청 허용
+    for _ in range(3):
+        main.time.sleep(0.06)
+        hits = http_server.hits
+        assert main.http_get(url).status_code == 503
+        assert http_server.hits == hits + 1
+        with pytest.raises(main.CircuitOpen):
+            main.http_get(url)
+
+    http_server.status = 200
+    main.time.sleep(0.06)
+    assert main.http_get(url).status_code == 200
+    assert main.http_get(url).status_code == 200
+
+
+def test_cancelled_probe_allows_next_probe():
+    breaker = main.CircuitBreaker("example", threshold=1, reset_after=0)
+    breaker.failure()
+    assert breaker.allow() is True
+    with pytest.raises(main.CircuitOpen):
+        breaker.allow()
+    breaker.cancel()
+    assert breaker.allow() is True
+
+
+def test_numbered_sequels_in_one_source_stay_separate(tmp_path):
+    index = main.GameIndex(tmp_path / "game_index.json")
+    new = {
+        "inven": [
+            {"id": "1", "title": "아스달 연대기 2", "url": "https://example.com/1"},
+            {"id": "2", "title": "아스달 연대기 3", "url": "https://example.com/2"},
+            {"id": "3", "title": "프로젝트 A", "url": "https://example.com/3"},
+            {"id": "4", "title": "프로젝트 B", "url": "https://example.com/4"},
+        ],
+        "kakao": [
+            {"id": "k1", "title": "아스달 연대기 3", "url": "https://example.com/k1"},
+        ],
+    }
+    # publish_results처럼 현재 목록 전체를 먼저 등록
+    for source, games in new.items():
+        for game in games:
+            index.resolve(source, game)
+    deduped = main.dedupe_new_games(index, new)
+
+    assert [g["id"] for g in deduped["inven"]] == ["1", "2", "3", "4"]
+    assert len({index.resolve("inven", g) for g in new["inven"]}) == 4
+    assert index.games[index.resolve("inven", new["inven"][0])]["links"]["inven"]["id"] == "1"
+    # 다른 소스의 같은 게임은 한 번만 알림
+    assert deduped["kakao"] == []
+    assert deduped["inven"][1]["also"] == [{"source": "kakao", "url": "https://example.com/k1"}]
+
+
+@pytest.mark.parametrize("inven_title, kakao_title", [
+    ("프로젝트 A", "프로젝트 B"),
+    ("아스달 연대기 2", "아스달 연대기 3"),
+    ("리니지2M", "리니지W"),
+    ("오딘", "오딘 II"),
+])
+def test_numbered_sequels_across_sources_stay_separate(tmp_path, inven_title, kakao_title):
+    index = main.GameIndex(tmp_path / "game_index.json")
+    new = {
+        "inven": [{"id": "1", "title": inven_title, "url": "https://example.com/1"}],
+        "kakao": [{"id": "k1", "title": kakao_title, "url": "https://example.com/k1"}],
+    }
+    for source, games in new.items():
+        for game in games:
+            index.resolve(source, game)
+    deduped = main.dedupe_new_games(index, new)
+
+    assert index.resolve("inven", new["inven"][0]) != index.resolve("kakao", new["kakao"][0])
+    assert [g["id"] for g in deduped["kakao"]] == ["k1"]
+    assert "also" not in deduped["inven"][0]
+
+
+def test_same_game_across_sources_still_merges(tmp_path):
+    index = main.GameIndex(tmp_path / "game_index.json")
+    inven = index.resolve("inven", {"id": "1", "title": "아스달 연대기 2 (사전예약)", "url": "https://example.com/1"})
+    kakao = index.resolve("kakao", {"id": "k1", "title": "아스달 연대기2", "url": "https://example.com/k1"})
+    assert inven == kakao
+
+
+def test_wrong_link_from_older_index_is_repaired(tmp_path):
+    path = tmp_path / "game_index.json"
+    path.write_text(main.json.dumps({"games": {"G000001": {
+        "title": "프로젝트 A", "developer": "",
+        "links": {"inven": {"id": "1", "url": "u1"}, "kakao": {"id": "k1", "url": "u2"}},
+    }}}), encoding="utf-8")
+    index = main.GameIndex(path)
+    cid = index.resolve("kakao", {"id": "k1", "title": "프로젝트 B", "url": "u2"})
+    assert cid != "G000001"
+    assert "kakao" not in index.games["G000001"]["links"]
+
+
+def test_naver_prefetch_threads_stop_when_current_month_fails(monkeypatch):
+    def pages(search_date, digest):
+        if search_date == first:
+            raise main.req.RequestException("boom")
+        for i in itertools.count():
+            yield {"gameId": f"{search_date}-{i}", "gameName": "게임"}
+
+    first = main._naver_search_dates(0)[0]
+    monkeypatch.setattr(main, "_iter_naver_pages", pages)
+    before = threading.active_count()
+    with pytest.raises(main.req.RequestException):
+        list(main.fetch_naver_games(months_ahead=2))
+
+    deadline = main.time.monotonic() + 3
+    while threading.active_count() > before and main.time.monotonic() < deadline:
+        main.time.sleep(0.05)
+    assert threading.active_count() == before
+
+
+def test_failed_detail_lookup_keeps_saved_developer(state_dir):
+    saved = main.GameRecord(id="1", title="게임", url="https://example.com/1", developer="넥슨")
+    main.save_games(main.SOURCES["inven"][2], [saved])
+
+    def fetch_developer(url):
+        raise main.req.ConnectionError("down")
+
+    current = [main.GameRecord(id="1", title="게임", url="https://example.com/1")]
+    enriched = list(main.enrich_stream("inven", current, fetch_developer))
+    assert enriched[0]["developer"] == "넥슨"
+    assert main.diff_games(enriched, main.load_saved(main.SOURCES["inven"][2]))["modified"] == []
+
+
+def test_gplay_auto_mode_falls_back_to_browser_when_circuit_opens(monkeypatch):
+    def http():
+        yield main.GameRecord(id="a", title="A", url="https://example.com/a")
+        raise main.CircuitOpen("play.google.com 회로 차단 중")
+
+    def browser():
+        yield main.GameRecord(id="a", title="A", url="https://example.com/a")
+        yield main.GameRecord(id="b", title="B", url="https://example.com/b")
+
+    monkeypatch.setattr(main, "GPLAY_MODE", "auto")
+    monkeypatch.setattr(main, "_fetch_gplay_games_http", http)
+    monkeypatch.setattr(main, "_fetch_gplay_games_browser", browser)
+    assert [g["id"] for g in main.fetch_gplay_games()] == ["a", "b"]
+
+
+def test_watch_abandons_hung_run_and_replaces_browser_thread(monkeypatch):
+    release = threading.Event()
+    calls = {"gplay": 0}
+    threads = []
+
+    def fake_run_source(key, results, profile_dir=None, check=None):
+        calls[key] += 1
+        threads.append(threading.current_thread())
+        if calls[key] == 1:
+            release.wait(10)  # 협조적 중단이 닿지 않는 블로킹 호출
+        results[key] = {"current": [], "new": [], "modified": [], "removed": [], "unchanged": False,
+                        "run": calls[key]}
+
+    published = []
+
+    def on_results(sources):
+        published.append(sources["gplay"].get("run"))
+        if len(published) == 2:
+            release.set()
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(main, "_run_source", fake_run_source)
+    monkeypatch.setattr(main.signal, "signal", lambda *args: None)
+    monkeypatch.setattr(main, "SOURCE_TIMEOUTS", {"gplay": 0.2})
+    monkeypatch.setattr(main, "SOURCE_HUNG_GRACE", 0.1)
+    main.watch(["gplay"], {"gplay": 0.05}, 1, on_results)
+
+    # 멈춘 실행은 실패(None)로 알리고, 다음 실행은 새 브라우저 스레드에서 진행
+    assert published == [None, 2]
+    assert threads[0] is not threads[1]
+
+
+def test_gplay_fallback_uses_cache_then_saved_list(state_dir):
+    saved_app = main.GameRecord(id="com.saved", title="저장된 게임", url="https://example.com/s", developer="넷마블")
+    main.save_games(main.SOURCES["gplay"][2], [saved_app])
+    main.enrich_cache.put("gplay", "com.cached", {"status": "foreign"})
+    saved = main.saved_lookup("gplay")
+
+    assert main._gplay_fallback_result("com.cached", saved) == {"status": "foreign"}
+    assert main._gplay_fallback_result("com.saved", saved) == {"status": "ok", "developer": "넷마블"}
+    assert main._gplay_fallback_result("com.unknown", saved) is None
+
+
+def test_gplay_auto_mode_uses_browser_when_http_list_is_short(state_dir, monkeypatch):
+    saved = [main.GameRecord(id=f"com.g{i}", title=f"게임 {i}", url="https://example.com") for i in range(10)]
+    main.save_games(main.SOURCES["gplay"][2], saved)
+
+    def http():
+        yield from saved[:3]
+
+    def browser():
+        yield from saved
+
+    monkeypatch.setattr(main, "_fetch_gplay_games_http", http)
+    monkeypatch.setattr(main, "_fetch_gplay_games_browser", browser)
+    monkeypatch.setattr(main, "GPLAY_MODE", "auto")
+    assert [g["id"] for g in main.fetch_gplay_games()] == [g["id"] for g in saved]
+    monkeypatch.setattr(main, "GPLAY_MODE", "http")
+    assert len(list(main.fetch_gplay_games())) == 3
+
+
+def test_source_output_keeps_each_source_together(monkeypatch):
+    stream = io.StringIO()
+    monkeypatch.setattr(main.sys, "stdout", main.SourceOutput(stream))
+    barrier = threading.Barrier(3)
+
+    def source(key):
+        main._source_ctx.key = key
+        with main.source_output(key):
+            for i in range(50):
+                print(f"[{key}] 항목", i)
+                if i == 0:
+                    barrier.wait()
+        main._source_ctx.key = None
+
+    def other():
+        barrier.wait()
+        for i in range(50):
+            print("[기타]", i)
+
+    threads = [threading.Thread(target=source, args=(k,)) for k in ("a", "b")] + [threading.Thread(target=other)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    sys.stdout.flush()
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 150
+    for key in ("a", "b"):
+        positions = [i for i, line in enumerate(lines) if line.startswith(f"[{key}]")]
+        assert positions == list(range(positions[0], positions[0] + 50))
+        assert [line for line in lines if line.startswith(f"[{key}]")] == [f"[{key}] 항목 {i}" for i in range(50)]
+    assert [line for line in lines if line.startswith("[기타]")] == [f"[기타] {i}" for i in range(50)]
+
+
+RSC_BODY = (
+    '0:["$",%22prodId%22%3A%22101%22%2C%22prodName%22%3A%22%EA%B2%8C%EC%9E%84%20A%22,'
+    '\\"prodId\\":\\"102\\",\\"prodName\\":\\"게임 B\\"'
+    '%5C%22prodId%5C%22:%5C%22103%5C%22,%5C%22prodName%5C%22:%5C%22C%5C%22 100%'
+    '"prodId":"104","prodName":"\\\\"},"prodId":"105","prodName":"E",'
+    '"prodId":"106",\\\\"prodName":"F"]'
+).encode()
+
+
+def _rsc_reference(body, pattern):
+    # 조각 처리 도입 전의 방식: 전체 본문 unquote 후 따옴표 복원
+    return pattern.findall(unquote(body.decode()).replace('\\"', '"'))
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64])
+def test_rsc_matches_are_the_same_for_any_chunk_size(size):
+    pattern = main.ONESTORE_PRODUCT_PATTERN
+    expected = _rsc_reference(RSC_BODY, pattern)
+    assert [m[0] for m in expected] == ["101", "102", "103", "104", "105"]
+    chunks = [RSC_BODY[i:i + size] for i in range(0, len(RSC_BODY), size)]
+    assert list(main.iter_rsc_matches(chunks, pattern)) == expected
+
+
+def test_rsc_matches_split_at_every_offset():
+    pattern = main.ONESTORE_PRODUCT_PATTERN
+    expected = _rsc_reference(RSC_BODY, pattern)
+    for cut in range(1, len(RSC_BODY)):
+        chunks = [RSC_BODY[:cut], RSC_BODY[cut:]]
+        assert list(main.iter_rsc_matches(chunks, pattern)) == expected, cut
+
+
+def test_rsc_match_longer_than_one_chunk_survives_carry(monkeypatch):
+    monkeypatch.setattr(main, "RSC_CARRY_SIZE", 64)
+    pattern = main.ONESTORE_SELLER_PATTERN
+    body = ("x" * 500 + '\\"sellerName\\":\\"' + "%EA%B0%80" * 5 + '\\"').encode()
+    chunks = [body[i:i + 4] for i in range(0, len(body), 4)]
+    assert list(main.iter_rsc_matches(chunks, pattern)) == [("가" * 5,)]
+
+
+def test_diff_games_classifies_added_removed_and_modified():
+    saved = [
+        main.GameRecord(id="1", title="유지", url="https://example.com/1"),
+        main.GameRecord(id="2", title="변경 전", url="https://example.com/2", developer="넥슨"),
+        main.GameRecord(id="3", title="삭제", url="https://example.com/3"),
+    ]
+    current = [
+        main.GameRecord(id="1", title="유지", url="https://example.com/1"),
+        main.GameRecord(id="2", title="변경 후", url="https://example.com/2", reward="쿠폰"),
+        main.GameRecord(id="4", title="추가", url="https://example.com/4"),
+    ]
+    # 이터레이터도 받는 대로 비교
+    diff = main.diff_games(iter(current), saved)
+
+    assert diff["current"] == current
+    assert [g["id"] for g in diff["added"]] == ["4"]
+    assert [g["id"] for g in diff["removed"]] == ["3"]
+    assert diff["modified"] == [{"game": current[1], "changes": {
+        "developer": ("넥슨", None),
+        "reward": (None, "쿠폰"),
+        "title": ("변경 전", "변경 후"),
+    }}]
+    assert main.diff_games(saved, saved)["modified"] == []
+
+
+def test_save_games_skips_write_when_fingerprints_match(tmp_path):
+    path = tmp_path / "games.json"
+    games = [main.GameRecord(id=str(i), title=f"게임 {i}", url="https://example.com") for i in range(3)]
+    assert main.save_games(path, games) is True
+    written = path.read_text(encoding="utf-8")
+
+    # 내용이 같은 새 레코드 목록이면 다시 쓰지 않음 (updated_at도 그대로)
+    same = [main.GameRecord(g) for g in games]
+    assert main.save_games(path, same) is False
+    assert path.read_text(encoding="utf-8") == written
+
+    # 필드 하나만 바뀌어도, 레코드가 빠져도 다시 씀
+    same[1]["developer"] = "넷마블"
+    assert main.save_games(path, same) is True
+    assert main.load_saved(path)[1]["developer"] == "넷마블"
+    assert main.save_games(path, same[:2]) is True
+    assert [g["id"] for g in main.load_saved(path)] == ["0", "1"]
+
+
+def _game_lines(blocks):
+    return [b["text"]["text"] for b in blocks if b["type"] == "section" and b["text"]["text"].startswith("• ")]
+
+
+def test_slack_messages_respect_block_limit_and_repeat_header():
+    changes = {
+        f"{key}_new": [{"id": str(i), "title": f"{key} {i}", "url": f"https://example.com/{i}"} for i in range(60)]
+        for key in ("gplay", "inven")
+    }
+    messages = main.build_slack_messages(changes)
+    footer = messages[-1][-3:]
+
+    assert len(messages) == 3
+    assert all(len(m) <= main.SLACK_MAX_BLOCKS for m in messages)
+    # 게임 줄은 빠지거나 겹치지 않고 순서대로
+    lines = [line for m in messages for line in _game_lines(m)]
+    assert lines == [f"• <https://example.com/{i}|{key} {i}>" for key in ("gplay", "inven") for i in range(60)]
+    # 이어지는 메시지는 직전 소스 헤더 + "(계속)"으로 시작하고, 구분선으로 시작하지 않음
+    assert messages[1][0]["text"]["text"] == "🎮 Google Play 사전등록 (계속)"
+    assert messages[2][0]["text"]["text"] == "📋 인벤 사전예약 (계속)"
+    assert all(m[0]["type"] == "header" for m in messages)
+    # footer는 마지막 메시지 끝에만
+    assert footer[-1]["type"] == "context"
+    assert all(footer[-1] not in m for m in messages[:-1])
+
+
+def test_chunk_blocks_moves_footer_to_its_own_message_when_full():
+    header = {"type": "header", "text": {"type": "plain_text", "text": "소스"}}
+    sections = [{"type": "section", "text": {"type": "mrkdwn", "text": f"• {i}"}} for i in range(6)]
+    footer = [{"type": "divider"}, {"type": "context", "elements": []}]
+
+    messages = main._chunk_blocks([header] + sections, footer, limit=4)
+    assert [len(m) for m in messages] == [4, 4, 2]
+    assert messages[1][0]["text"]["text"] == "소스 (계속)"
+    assert messages[1][1:] == sections[3:]
+    assert messages[2] == footer
+
+    # 자리가 남으면 footer는 마지막 메시지에 바로 붙음
+    messages = main._chunk_blocks([header] + sections[:1], footer, limit=4)
+    assert messages == [[header, sections[0]] + footer]
+
+
+def test_snapshot_archive_round_trip(tmp_path):
+    archive = main.SnapshotArchive(tmp_path)
+    games = [
+        main.GameRecord(id="1", title="게임 A", url="https://example.com/1", developer="넥슨"),
+        main.GameRecord(id="2", title="게임 B", url="https://example.com/2", reward="쿠폰", also=["kakao"]),
+    ]
+    entry = archive.append("inven", games, taken_at="2026-01-10T09:00:00")
+    archive.append("kakao", games[:1], taken_at="2026-01-11T09:00:00")
+
+    assert set(entry["columns"]) == {"id", "title", "url", "reward", "developer", "extra"}
+    reopened = main.SnapshotArchive(tmp_path)
+    assert [e["source"] for e in reopened.entries()] == ["inven", "kakao"]
+    loaded = reopened.load(reopened.latest("inven"))
+    assert [dict(g) for g in loaded] == [dict(g) for g in games]
+    assert "developer" not in loaded[1]
+    assert [dict(g) for g in reopened.load(reopened.latest("kakao"))] == [dict(games[0])]
+
+
+def test_snapshot_archive_skips_torn_index_line(tmp_path):
+    archive = main.SnapshotArchive(tmp_path)
+    archive.append("inven", [main.GameRecord(id="1", title="A", url="u")], taken_at="2026-01-10T09:00:00")
+    # 색인 줄을 쓰다가 끊긴 상황
+    with open(tmp_path / archive.INDEX_NAME, "a", encoding="utf-8") as f:
+        f.write('{"source": "inven", "taken_at": "2026-01-1')
+
+    reopened = main.SnapshotArchive(tmp_path)
+    assert len(reopened.entries()) == 1
+    reopened.append("inven", [main.GameRecord(id="2", title="B", url="u")], taken_at="2026-01-12T09:00:00")
+
+    # 다음 기록은 새 줄에서 시작하므로 끊긴 줄만 버려짐
+    entries = main.SnapshotArchive(tmp_path).entries()
+    assert [e["taken_at"] for e in entries] == ["2026-01-10T09:00:00", "2026-01-12T09:00:00"]
+    assert [g["id"] for g in reopened.load(entries[-1])] == ["2"]
+
+
+def test_query_archive_counts_games_and_new_per_period(tmp_path):
+    archive = main.SnapshotArchive(tmp_path)
+
+    def snapshot(source, taken_at, ids):
+        archive.append(source, [main.GameRecord(id=i, title=i, url="u") for i in ids], taken_at=taken_at)
+
+    snapshot("inven", "2026-01-10T09:00:00", ["1", "2"])
+    snapshot("inven", "2026-02-05T09:00:00", ["2", "3"])
+    snapshot("inven", "2026-02-20T09:00:00", ["3", "4"])
+    snapshot("kakao", "2026-03-15T09:00:00", ["9"])
+    snapshot("inven", "2026-04-01T09:00:00", ["4"])
+
+    rows = main.query_archive(archive, ["inven", "kakao"], since="2026-02", until="2026-04")
+    assert [(r["period"], r["source"], r["snapshots"], r["games"], r["new"]) for r in rows] == [
+        # 1월 스냅샷이 2월 시작 시점의 목록이자 신규 판단 기준
+        ("2026-02", "inven", 2, 4, 2),
+        # 스냅샷이 없는 달도 직전 목록이 이어짐
+        ("2026-03", "inven", 0, 2, 0),
+        ("2026-03", "kakao", 1, 1, 1),
+        ("2026-04", "inven", 1, 2, 0),
+        ("2026-04", "kakao", 0, 1, 0),
+    ]
+
+    rows = main.query_archive(archive, ["inven"], since="2026-02-20", until="2026-02-21", by="day")
+    assert [(r["period"], r["snapshots"], r["games"], r["new"]) for r in rows] == [
+        ("2026-02-20", 1, 3, 1),
+        ("2026-02-21", 0, 2, 0),
+    ]
+
+
+def test_history_command_prints_first_and_last_seen(tmp_path, capsys, monkeypatch):
+    db = tmp_path / "state.db"
+    store = main.StateStore(db)
+    store.upsert("inven", [{"id": "1", "title": "빠진 게임"}, {"id": "2", "title": "남은 게임"}],
+                 seen_at="2026-09-01T09:00:00")
+    store.upsert("inven", [{"id": "2", "title": "남은 게임"}], seen_at="2026-10-01T09:00:00")
+    store.close()
+
+    assert main.main(["history", "--db", str(db), "--sources", "inven"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "[인벤] 2개 (현재 목록 1개)"
+    assert lines[2].split() == ["2026-09-01", "2026-09-01", "빠짐", "빠진", "게임"]
+    assert lines[3].split() == ["2026-09-01", "2026-10-01", "목록", "남은", "게임"]
+
+    monkeypatch.setattr(main, "STATE_DB", None)
+    with pytest.raises(SystemExit):
+        main.main(["history", "--sources", "inven"])